@@ -25,3 +25,5 @@ class AgentState(TypedDict):
     # Execution tracking
     errors: List[str]
     execution_start: Optional[float]
+    # Monotonic start (time.perf_counter_ns); immune to wall-clock steps
+    execution_start_ns: Optional[int]
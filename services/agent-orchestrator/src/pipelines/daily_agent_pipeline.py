@@ -84,7 +84,10 @@ class DailyAgentPipeline:
                 "risk_output": None,
                 "recommendation": None,
                 "errors": [],
-                "execution_start": time.time()
+                "execution_start": time.time(),
+                # Monotonic clock for duration measurement; the writer
+                # derives completed_at from it instead of a second syscall
+                "execution_start_ns": time.perf_counter_ns(),
             }
 
             final_state = self.agent_graph.invoke(initial_state)
@@ -2,8 +2,9 @@
 Write agent outputs and recommendations to database.
 """
 from typing import Dict, Any, List
-from datetime import datetime
+from datetime import datetime, timedelta
 import json
+import time
 import sys
 from pathlib import Path
 
@@ -148,8 +149,17 @@ class AgentOutputWriter:
                 if isinstance(start_ts, (int, float))
                 else datetime.utcnow()
             )
-            completed_at = datetime.utcnow()
-            duration_seconds = (completed_at - started_at).total_seconds()
+
+            # Prefer the pipeline's monotonic start: one perf_counter_ns
+            # read replaces a second wall-clock syscall and the duration
+            # is immune to clock adjustments mid-run
+            start_ns = final_state.get("execution_start_ns")
+            if isinstance(start_ns, int):
+                duration_seconds = (time.perf_counter_ns() - start_ns) / 1e9
+                completed_at = started_at + timedelta(seconds=duration_seconds)
+            else:
+                completed_at = datetime.utcnow()
+                duration_seconds = (completed_at - started_at).total_seconds()
 
             execution_id = final_state.get("execution_id") or f"{final_state.get('ticker')}_{final_state.get('as_of_date')}"
             status = "success" if not final_state.get("errors") else "failed"
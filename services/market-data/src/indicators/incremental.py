@@ -0,0 +1,193 @@
+"""
+Incremental technical-indicator updates for live bars.
+
+TechnicalIndicatorCalculator recomputes every indicator over the full
+price history, which is O(N x window) per new bar. The indicators it
+produces all have recurrence forms (EMA/Wilder smoothing) or fixed-size
+rolling windows, so a small state object can absorb one bar at a time in
+O(1) work independent of history length. Used by the live feed and by
+backtests that step bar-by-bar.
+
+The recurrences mirror the `ta` implementations exactly (same seeding,
+same warm-up masking), so incremental values match the batch calculator
+to floating-point noise.
+"""
+from collections import deque
+from dataclasses import dataclass, field
+
+import numpy as np
+
+# Warm-up lengths after which each output becomes non-None, matching the
+# min_periods masking in the batch calculator
+_RSI_WINDOW = 14
+_ATR_WINDOW = 14
+_BB_WINDOW = 20
+_VOL_WINDOW = 30
+_MACD_FAST, _MACD_SLOW, _MACD_SIGN = 12, 26, 9
+
+
+def _ema_step(prev: float, value: float, span: int) -> float:
+    """One ewm(span, adjust=False) step: prev + alpha * (value - prev)."""
+    alpha = 2.0 / (span + 1.0)
+    return prev + alpha * (value - prev)
+
+
+def _wilder_step(prev: float, value: float, window: int) -> float:
+    """One Wilder-smoothing step: (prev * (n - 1) + value) / n."""
+    return (prev * (window - 1) + value) / window
+
+
+@dataclass(slots=True)
+class TechnicalIndicatorState:
+    """
+    Recurrence state for one ticker's indicator stream.
+
+    Feed bars in date order via update(); each call returns the same
+    indicator dict shape as extract_indicators_for_date, with None for
+    indicators still inside their warm-up window. Scalar accumulators
+    cover the EMA/Wilder family; bounded deques hold only the fixed
+    window tails needed for the SMA/Bollinger/volatility rollups.
+    """
+
+    bar_count: int = 0
+    prev_close: float = 0.0
+
+    # EMA / MACD accumulators (seeded on first applicable bar)
+    ema_12: float = 0.0
+    ema_26: float = 0.0
+    macd_signal: float = 0.0
+    macd_count: int = 0  # Bars since macd became valid, for signal warm-up
+
+    # Wilder accumulators
+    avg_gain_14: float = 0.0
+    avg_loss_14: float = 0.0
+    atr_14: float = 0.0
+    _atr_seed: list = field(default_factory=list)  # First 14 TRs, SMA-seeded
+
+    # OBV accumulator
+    obv: float = 0.0
+
+    # Fixed window tails (largest SMA window bounds the close history)
+    _closes: deque = field(default_factory=lambda: deque(maxlen=200))
+    _log_returns: deque = field(default_factory=lambda: deque(maxlen=_VOL_WINDOW))
+
+    @classmethod
+    def from_history(cls, df) -> "TechnicalIndicatorState":
+        """
+        Warm a state up by replaying a price DataFrame (date-sorted
+        columns open/high/low/close/volume) — one O(N) pass at startup,
+        O(1) per live bar afterwards.
+        """
+        state = cls()
+        for row in df.sort_values("date").itertuples(index=False):
+            state.update(row.open, row.high, row.low, row.close, row.volume)
+        return state
+
+    def update(self, open_: float, high: float, low: float, close: float,
+               volume: float) -> dict:
+        """
+        Absorb one bar and return the indicator values as of that bar.
+
+        Returns the extract_indicators_for_date dict shape; indicators
+        inside their warm-up window are None.
+        """
+        first_bar = self.bar_count == 0
+        self.bar_count += 1
+
+        # --- EMA / MACD (ewm adjust=False: seed with the first value)
+        if first_bar:
+            self.ema_12 = close
+            self.ema_26 = close
+        else:
+            self.ema_12 = _ema_step(self.ema_12, close, _MACD_FAST)
+            self.ema_26 = _ema_step(self.ema_26, close, _MACD_SLOW)
+        macd = self.ema_12 - self.ema_26
+        # The signal EMA sees macd only once it is past its own warm-up
+        if self.bar_count >= _MACD_SLOW:
+            self.macd_signal = (
+                macd if self.macd_count == 0
+                else _ema_step(self.macd_signal, macd, _MACD_SIGN)
+            )
+            self.macd_count += 1
+
+        # --- RSI (Wilder EMA of gains/losses; the batch path zero-fills
+        # the first diff, so the averages seed at 0 on the first bar)
+        if not first_bar:
+            diff = close - self.prev_close
+            gain = diff if diff > 0 else 0.0
+            loss = -diff if diff < 0 else 0.0
+            self.avg_gain_14 = _wilder_step(self.avg_gain_14, gain, _RSI_WINDOW)
+            self.avg_loss_14 = _wilder_step(self.avg_loss_14, loss, _RSI_WINDOW)
+
+        # --- ATR (SMA seed over the first 14 TRs, then Wilder updates)
+        if first_bar:
+            tr = high - low
+        else:
+            tr = max(high - low, abs(high - self.prev_close),
+                     abs(low - self.prev_close))
+        if len(self._atr_seed) < _ATR_WINDOW:
+            self._atr_seed.append(tr)
+            if len(self._atr_seed) == _ATR_WINDOW:
+                self.atr_14 = sum(self._atr_seed) / _ATR_WINDOW
+        else:
+            self.atr_14 = _wilder_step(self.atr_14, tr, _ATR_WINDOW)
+
+        # --- OBV (equal or rising close adds volume, falling subtracts)
+        self.obv += volume if first_bar or close >= self.prev_close else -volume
+
+        # --- Rolling windows
+        if not first_bar and close > 0 and self.prev_close > 0:
+            self._log_returns.append(np.log(close / self.prev_close))
+        self._closes.append(close)
+        self.prev_close = close
+
+        return self._snapshot(macd)
+
+    def _sma(self, window: int):
+        if len(self._closes) < window:
+            return None
+        tail = list(self._closes)[-window:]
+        return sum(tail) / window
+
+    def _snapshot(self, macd: float) -> dict:
+        n = self.bar_count
+        sma_20 = self._sma(20)
+
+        rsi = None
+        if n >= _RSI_WINDOW:
+            if self.avg_loss_14 == 0:
+                rsi = 100.0
+            else:
+                rsi = 100.0 - 100.0 / (1.0 + self.avg_gain_14 / self.avg_loss_14)
+
+        bollinger_upper = bollinger_lower = None
+        if sma_20 is not None:
+            # Population std (ddof=0), matching the batch Bollinger bands
+            std = float(np.std(list(self._closes)[-_BB_WINDOW:]))
+            bollinger_upper = sma_20 + 2.0 * std
+            bollinger_lower = sma_20 - 2.0 * std
+
+        volatility = None
+        if len(self._log_returns) == _VOL_WINDOW:
+            # Sample std (ddof=1), annualized over 252 trading days
+            volatility = float(np.std(self._log_returns, ddof=1) * np.sqrt(252))
+
+        signal_valid = self.macd_count >= _MACD_SIGN
+        signal = self.macd_signal if signal_valid else None
+        return {
+            "sma_20": sma_20,
+            "sma_50": self._sma(50),
+            "sma_200": self._sma(200),
+            "ema_12": self.ema_12 if n >= _MACD_FAST else None,
+            "ema_26": self.ema_26 if n >= _MACD_SLOW else None,
+            "rsi_14": rsi,
+            "macd": macd if n >= _MACD_SLOW else None,
+            "macd_signal": signal,
+            "macd_histogram": macd - signal if signal_valid else None,
+            "bollinger_upper": bollinger_upper,
+            "bollinger_middle": sma_20,
+            "bollinger_lower": bollinger_lower,
+            "atr_14": self.atr_14 if n >= _ATR_WINDOW else None,
+            "obv": self.obv,
+            "volatility_30d": volatility,
+        }
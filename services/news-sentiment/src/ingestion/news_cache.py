@@ -1,3 +1,4 @@
+import hashlib
 import json
 import shutil
 from datetime import datetime
@@ -14,6 +15,14 @@ sys.path.insert(0, str(project_root))
 
 
 class NewsSeenCache:
+    @staticmethod
+    def url_digest(ticker: str, url: str) -> bytes:
+        """
+        Compact 8-byte SHA-256 digest of (ticker, url).
+        Keeps the seen-URL set small regardless of URL length.
+        """
+        return hashlib.sha256(f"{ticker}|{url}".encode("utf-8")).digest()[:8]
+
     def __init__(self, cache_dir: Path, ticker: str):
         self.cache_dir = cache_dir
         self.cache_dir.mkdir(parents=True, exist_ok=True)
@@ -58,11 +67,11 @@ class NewsSeenCache:
         except Exception as e:
             logger.warning(f"Failed to backup news cache: {e}")
 
-    def load(self) -> tuple[Set[Tuple[str, str]], Set[Tuple[str, str, datetime]]]:
+    def load(self) -> tuple[Set[bytes], Set[Tuple[str, str, datetime]]]:
         """
-        Load cached URLs and (headline, published_at) keys for this ticker.
+        Load cached URL digests and (headline, published_at) keys for this ticker.
         """
-        urls: Set[Tuple[str, str]] = set()  # (ticker, url)
+        urls: Set[bytes] = set()  # url_digest(ticker, url)
         keys: Set[Tuple[str, str, datetime]] = set()  # (ticker, headline, published_at)
 
         if not self.path.exists():
@@ -79,7 +88,7 @@ class NewsSeenCache:
                     ticker = (row.get("ticker") or self.ticker).upper()
 
                     if ticker and url:
-                        urls.add((ticker, url))
+                        urls.add(self.url_digest(ticker, url))
 
                     if ticker and headline and published_at:
                         keys.add(
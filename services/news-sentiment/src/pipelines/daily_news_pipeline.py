@@ -18,6 +18,7 @@ import pandas as pd
 
 from ..ingestion.fetch_news import NewsFetcher
 from ..processing.sentiment_scoring import SentimentScorer
+from ..processing.dedup import dedup_near
 from ..processing.aggregation import SentimentAggregator
 from ..storage.db_writer import NewsDataWriter
 from ..config import config
@@ -166,7 +167,7 @@ class DailyNewsSentimentPipeline:
                 url = str(row.get("url") or "")
                 headline = str(row.get("headline") or "")
                 ts = _normalize_ts(row.get("published_at"))
-                if url and (ticker, url) in self.existing_urls:
+                if url and NewsSeenCache.url_digest(ticker, url) in self.existing_urls:
                     return False
                 if headline and (ticker, headline, ts) in combined_existing_keys_for_insert:
                     return False
@@ -192,7 +193,9 @@ class DailyNewsSentimentPipeline:
                         }
                     )
                     if row.get("url"):
-                        self.existing_urls.add((ticker, str(row.get("url"))))
+                        self.existing_urls.add(
+                            NewsSeenCache.url_digest(ticker, str(row.get("url")))
+                        )
                     if row.get("headline") and published_at:
                         self.existing_keys.add((ticker, row.get("headline"), published_at))
 
@@ -220,6 +223,9 @@ class DailyNewsSentimentPipeline:
 
             sentiment_input_df = articles_df[articles_df.apply(_needs_sentiment, axis=1)].copy()
 
+            # Drop syndicated near-duplicates before spending model calls on them
+            sentiment_input_df = dedup_near(sentiment_input_df)
+
             if sentiment_input_df.empty:
                 logger.info(f"[{ticker}] All fetched articles already scored; skipping sentiment.")
                 return {
@@ -2,13 +2,123 @@
 Daily sentiment aggregation.
 Aggregates sentiment scores by ticker and date for feature store consumption.
 """
-from collections import Counter
 from typing import List
 
 import pandas as pd
 import numpy as np
 from loguru import logger
 
+from .theme_vocab import decode_themes, encode_themes, vocab_size
+
+
+def _top_themes_per_group(
+    theme_lists: List,
+    group_ids: np.ndarray,
+    num_groups: int,
+    top_n: int = 5,
+) -> List[List[str]]:
+    """
+    Top-N most common themes for every group in one vectorized pass.
+
+    Rows carry either theme strings or pre-encoded int32 code arrays
+    (the scorer's theme_codes column); everything is flattened into one
+    int32 code array against the process-wide vocabulary, (group, theme)
+    pairs are counted with np.unique and ranked within groups via a
+    single lexsort — no per-group Counter loop. Codes decode back to
+    strings only for the kept top-N entries.
+
+    Args:
+        theme_lists: One theme list or int32 code array per row
+        group_ids: Group id per row, aligned with theme_lists
+        num_groups: Total number of groups
+        top_n: Number of top themes per group
+
+    Returns:
+        List of top-N theme lists indexed by group id
+    """
+    lengths = np.fromiter(
+        (len(t) if isinstance(t, (list, np.ndarray)) else 0 for t in theme_lists),
+        dtype=np.int64,
+        count=len(theme_lists),
+    )
+    total = int(lengths.sum())
+    if total == 0:
+        return [[] for _ in range(num_groups)]
+
+    flat_codes = np.empty(total, dtype=np.int64)
+    pos = 0
+    for themes, length in zip(theme_lists, lengths):
+        if length:
+            if isinstance(themes, np.ndarray):
+                flat_codes[pos:pos + length] = themes
+            else:
+                flat_codes[pos:pos + length] = encode_themes(themes)
+            pos += length
+
+    num_themes = vocab_size()
+    theme_groups = np.repeat(group_ids, lengths)
+
+    # Count occurrences of each (group, theme) pair via combined int keys
+    pair_keys, pair_counts = np.unique(
+        theme_groups.astype(np.int64) * num_themes + flat_codes,
+        return_counts=True,
+    )
+    pair_groups = pair_keys // num_themes
+    pair_codes = pair_keys % num_themes
+
+    # Order pairs by (group, count desc) and keep each group's first top_n
+    order = np.lexsort((-pair_counts, pair_groups))
+    pair_groups = pair_groups[order]
+    pair_codes = pair_codes[order]
+
+    group_starts = np.searchsorted(pair_groups, np.arange(num_groups), side="left")
+    rank_in_group = np.arange(len(pair_groups)) - group_starts[pair_groups]
+    keep = rank_in_group < top_n
+
+    top_themes: List[List[str]] = [[] for _ in range(num_groups)]
+    for group, name in zip(pair_groups[keep], decode_themes(pair_codes[keep])):
+        top_themes[group].append(name)
+
+    return top_themes
+
+
+def _reduce_groups(
+    scores: np.ndarray,
+    confidences: np.ndarray,
+    signal_codes: np.ndarray,
+    group_ids: np.ndarray,
+    num_groups: int,
+):
+    """
+    Single-pass numeric reduction over all (ticker, date) groups.
+
+    np.bincount with weights compiles each sum to one C loop over the
+    whole frame, so per-group averages, weighted averages and bucket
+    counts cost O(N) total instead of per-group Python work.
+
+    Returns:
+        Tuple of arrays indexed by group id:
+        (avg, weighted, counts, positive, neutral, negative)
+    """
+    counts = np.bincount(group_ids, minlength=num_groups)
+    score_sums = np.bincount(group_ids, weights=scores, minlength=num_groups)
+    conf_sums = np.bincount(group_ids, weights=confidences, minlength=num_groups)
+    weighted_sums = np.bincount(
+        group_ids, weights=scores * confidences, minlength=num_groups
+    )
+
+    positive = np.bincount(group_ids[signal_codes == 1], minlength=num_groups)
+    negative = np.bincount(group_ids[signal_codes == -1], minlength=num_groups)
+    neutral = counts - positive - negative
+
+    avg = score_sums / counts
+    # Fall back to the simple average where confidences sum to zero
+    weighted = np.where(
+        conf_sums > 0, weighted_sums / np.maximum(conf_sums, 1e-12), avg
+    )
+
+    return avg, weighted, counts, positive, neutral, negative
+
 
 class SentimentAggregator:
     """
@@ -39,105 +149,67 @@ class SentimentAggregator:
 
         logger.info(f"Aggregating sentiment for {len(sentiment_df)} articles")
 
-        # Extract date from published_at
-        sentiment_df["date"] = pd.to_datetime(sentiment_df["published_at"]).dt.date
-
-        # Group by ticker and date
-        aggregates = []
-
-        for (ticker, date), group in sentiment_df.groupby(["ticker", "date"]):
-            aggregate = self._aggregate_group(ticker, date, group)
-            aggregates.append(aggregate)
-
-        result_df = pd.DataFrame(aggregates)
-
-        # Sort by ticker and date (deterministic)
-        result_df = result_df.sort_values(["ticker", "date"]).reset_index(drop=True)
+        # Extract the day as datetime64[D] so the groupby hashes native
+        # int64 keys instead of an object column of boxed datetime.date.
+        # Encode each article's sentiment bucket once as an int8 column
+        # (schemas SignalCode values: +1 bullish, 0 neutral, -1 bearish)
+        # so per-group counting is integer compares over the whole frame
+        # Categorical ticker lets the groupby hash small int codes instead
+        # of re-hashing the same strings once per row
+        scores = sentiment_df["sentiment_score"].to_numpy(dtype=np.float32)
+        sentiment_df = sentiment_df.assign(
+            ticker=sentiment_df["ticker"].astype("category"),
+            date=pd.to_datetime(sentiment_df["published_at"]).values.astype("datetime64[D]"),
+            signal_code=(scores > 0.1).astype(np.int8) - (scores < -0.1).astype(np.int8),
+        )
+
+        # Group by ticker and date; both the numeric reductions and the
+        # top-theme selection run in vectorized passes over the whole frame
+        grouped = sentiment_df.groupby(["ticker", "date"], sort=True, observed=True)
+        group_ids = grouped.ngroup().to_numpy()
+        num_groups = int(group_ids.max()) + 1
+
+        avg, weighted, counts, positive, neutral, negative = _reduce_groups(
+            scores=sentiment_df["sentiment_score"].to_numpy(dtype=np.float64),
+            confidences=sentiment_df["confidence"].to_numpy(dtype=np.float64),
+            signal_codes=sentiment_df["signal_code"].to_numpy(),
+            group_ids=group_ids,
+            num_groups=num_groups,
+        )
+
+        # Top themes per group (most common), one flat pass over all
+        # rows; prefer the scorer's pre-encoded int32 codes when present
+        theme_column = (
+            "theme_codes" if "theme_codes" in sentiment_df.columns else "themes"
+        )
+        top_themes = _top_themes_per_group(
+            sentiment_df[theme_column].tolist(), group_ids, num_groups
+        )
+
+        # Sorted (ticker, date) keys per group id, matching ngroup order
+        keys = grouped.size().index
+
+        result_df = pd.DataFrame({
+            "ticker": keys.get_level_values("ticker"),
+            # datetime64[D] -> object yields datetime.date in one C pass
+            "date": keys.get_level_values("date")
+                    .values.astype("datetime64[D]").astype(object),
+            "avg_sentiment": avg,
+            "weighted_sentiment": weighted,
+            "article_count": counts,
+            "positive_count": positive,
+            "neutral_count": neutral,
+            "negative_count": negative,
+            "top_themes": top_themes,
+        })
+
+        # Already sorted by ticker and date via the sorted groupby (deterministic)
+        result_df = result_df.reset_index(drop=True)
 
         logger.info(f"Created {len(result_df)} daily aggregates")
 
         return result_df
 
-    def _aggregate_group(
-        self,
-        ticker: str,
-        date,
-        group: pd.DataFrame
-    ) -> dict:
-        """
-        Aggregate a single group (ticker, date).
-
-        Args:
-            ticker: Stock ticker symbol
-            date: Date
-            group: DataFrame with articles for this ticker and date
-
-        Returns:
-            Dict with aggregated metrics
-        """
-        article_count = len(group)
-
-        # Average sentiment (simple average)
-        avg_sentiment = group["sentiment_score"].mean()
-
-        # Weighted sentiment (weighted by confidence)
-        if group["confidence"].sum() > 0:
-            weighted_sentiment = (
-                (group["sentiment_score"] * group["confidence"]).sum()
-                / group["confidence"].sum()
-            )
-        else:
-            weighted_sentiment = avg_sentiment
-
-        # Sentiment distribution
-        positive_count = int((group["sentiment_score"] > 0.1).sum())
-        neutral_count = int((group["sentiment_score"].abs() <= 0.1).sum())
-        negative_count = int((group["sentiment_score"] < -0.1).sum())
-
-        # Top themes (most common)
-        top_themes = self._extract_top_themes(group["themes"])
-
-        return {
-            "ticker": ticker,
-            "date": date,
-            "avg_sentiment": float(avg_sentiment),
-            "weighted_sentiment": float(weighted_sentiment),
-            "article_count": article_count,
-            "positive_count": positive_count,
-            "neutral_count": neutral_count,
-            "negative_count": negative_count,
-            "top_themes": top_themes
-        }
-
-    def _extract_top_themes(self, themes_series: pd.Series, top_n: int = 5) -> List[str]:
-        """
-        Extract top N most common themes from a series of theme lists.
-
-        Args:
-            themes_series: Series where each element is a list of themes
-            top_n: Number of top themes to return
-
-        Returns:
-            List of top N themes
-        """
-        # Flatten all themes
-        all_themes = []
-        for themes in themes_series:
-            if isinstance(themes, list):
-                all_themes.extend(themes)
-
-        if not all_themes:
-            return []
-
-        # Count occurrences
-        theme_counts = Counter(all_themes)
-
-        # Get top N
-        top_themes = [theme for theme, count in theme_counts.most_common(top_n)]
-
-        return top_themes
-
-
 if __name__ == "__main__":
     # Test aggregator
     aggregator = SentimentAggregator()
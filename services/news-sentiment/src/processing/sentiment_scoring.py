@@ -2,15 +2,50 @@
 Sentiment analysis using OpenAI GPT-4o-mini.
 Analyzes news articles and extracts sentiment scores, confidence, and themes.
 """
-import json
+import asyncio
+import functools
 from typing import List, Dict
-import time
 
+import msgspec
+import numpy as np
 import pandas as pd
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 from loguru import logger
 
 from ..config import config
+from .theme_vocab import encode_themes
+
+
+@functools.lru_cache(maxsize=1)
+def _get_client() -> OpenAI:
+    """Process-wide sync client; reuses one connection pool and TLS session."""
+    return OpenAI(api_key=config.OPENAI_API_KEY)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_async_client() -> AsyncOpenAI:
+    """Process-wide async client shared by all scorer instances."""
+    return AsyncOpenAI(api_key=config.OPENAI_API_KEY)
+
+
+class _SentimentResponse(msgspec.Struct):
+    """Expected shape of one article's model reply; defaults mirror json.get fallbacks."""
+
+    sentiment_score: float = 0.0
+    confidence: float = 0.5
+    themes: List[str] = []
+
+
+class _BatchSentimentResponse(msgspec.Struct):
+    """Expected shape of a batched multi-article model reply."""
+
+    results: List[_SentimentResponse] = []
+
+
+# Parsing and shape validation happen in one C call; reused decoders
+# avoid rebuilding decoder state per response
+_SENTIMENT_DECODER = msgspec.json.Decoder(_SentimentResponse)
+_BATCH_DECODER = msgspec.json.Decoder(_BatchSentimentResponse)
 
 
 class SentimentScorer:
@@ -19,9 +54,44 @@ class SentimentScorer:
     Deterministic and reproducible (temperature=0).
     """
 
+    # Prompt templates are class constants so the fixed instruction block
+    # is allocated once instead of being rebuilt on every call
+    _PROMPT_TEMPLATE_NO_CONTENT = """Analyze the sentiment of this financial news article about {ticker}:
+
+Headline: {headline}
+
+Return a JSON object with exactly these fields:
+{{
+  "sentiment_score": <float between -1.0 and 1.0, where -1.0 is very negative, 0.0 is neutral, 1.0 is very positive>,
+  "confidence": <float between 0.0 and 1.0, indicating how confident you are in the sentiment score>,
+  "themes": [<list of 1-5 key themes or topics, such as "earnings", "product_launch", "lawsuit", "partnership", etc.>]
+}}
+
+Be precise and objective. Focus on the financial implications for the stock price."""
+
+    _PROMPT_TEMPLATE_WITH_CONTENT = _PROMPT_TEMPLATE_NO_CONTENT.replace(
+        "Headline: {headline}", "Headline: {headline}\\n\\nContent: {content}"
+    )
+
+    _BATCH_PROMPT_TEMPLATE = """Analyze the sentiment of each of the following financial news articles:
+
+{articles}
+
+Return a JSON object with exactly this field:
+{{
+  "results": [one entry per article, in the same order, each an object with:
+    "sentiment_score": <float between -1.0 and 1.0, where -1.0 is very negative, 0.0 is neutral, 1.0 is very positive>,
+    "confidence": <float between 0.0 and 1.0, indicating how confident you are in the sentiment score>,
+    "themes": [<list of 1-5 key themes or topics, such as "earnings", "product_launch", "lawsuit", "partnership", etc.>]
+  ]
+}}
+
+Be precise and objective. Focus on the financial implications for each stock price."""
+
     def __init__(self):
-        """Initialize OpenAI client."""
-        self.client = OpenAI(api_key=config.OPENAI_API_KEY)
+        """Attach shared OpenAI clients (sync for single calls, async for batches)."""
+        self.client = _get_client()
+        self.async_client = _get_async_client()
         self.model = config.SENTIMENT_MODEL
         self.version = config.SENTIMENT_VERSION
 
@@ -36,7 +106,8 @@ class SentimentScorer:
 
         Returns:
             DataFrame with additional columns:
-            [article_id, sentiment_score, confidence, themes, model_name, model_version]
+            [article_id, sentiment_score, confidence, themes, theme_codes,
+             model_name, model_version]
         """
         if articles_df.empty:
             logger.warning("No articles to analyze")
@@ -44,64 +115,170 @@ class SentimentScorer:
 
         logger.info(f"Analyzing sentiment for {len(articles_df)} articles")
 
-        results = []
-
-        # Process in batches to avoid rate limits
-        batch_size = config.SENTIMENT_BATCH_SIZE
-        for i in range(0, len(articles_df), batch_size):
-            batch = articles_df.iloc[i:i + batch_size]
-
-            for _, article in batch.iterrows():
-                try:
-                    sentiment = self._analyze_single_article(
-                        ticker=article["ticker"],
-                        headline=article["headline"],
-                        content=article.get("content", "")
-                    )
-
-                    results.append({
-                        "ticker": article["ticker"],
-                        "published_at": article["published_at"],
-                        "headline": article["headline"],
-                        "content": article.get("content", ""),
-                        "source": article["source"],
-                        "url": article.get("url", ""),
-                        "author": article.get("author", ""),
-                        "sentiment_score": sentiment["sentiment_score"],
-                        "confidence": sentiment["confidence"],
-                        "themes": sentiment["themes"],
-                        "model_name": self.model,
-                        "model_version": self.version
-                    })
-
-                except Exception as e:
-                    logger.error(f"Error analyzing article: {e}")
-                    # Continue with default values
-                    results.append({
-                        "ticker": article["ticker"],
-                        "published_at": article["published_at"],
-                        "headline": article["headline"],
-                        "content": article.get("content", ""),
-                        "source": article["source"],
-                        "url": article.get("url", ""),
-                        "author": article.get("author", ""),
-                        "sentiment_score": 0.0,
-                        "confidence": 0.0,
-                        "themes": [],
-                        "model_name": self.model,
-                        "model_version": self.version
-                    })
-
-            # Rate limiting between batches
-            if i + batch_size < len(articles_df):
-                logger.info(f"Processed {i + batch_size}/{len(articles_df)} articles, brief pause...")
-                time.sleep(1)  # 1 second between batches
-
-        sentiment_df = pd.DataFrame(results)
+        # The workload is network-latency-bound, so dispatch all prompts
+        # concurrently; the semaphore in _analyze_batch_async caps in-flight
+        # requests at the per-batch rate limit instead of sleeping between
+        # serial batches
+        sentiments = asyncio.run(self._analyze_batch_async(articles_df))
+
+        # Accumulate raw values into typed arrays; articles that errored
+        # keep the neutral zero defaults
+        n = len(articles_df)
+        scores = np.zeros(n, dtype=np.float64)
+        confidences = np.zeros(n, dtype=np.float64)
+        themes: List[list] = [[]] * n
+
+        for i, sentiment in enumerate(sentiments):
+            if isinstance(sentiment, Exception):
+                logger.error(f"Error analyzing article: {sentiment}")
+                continue
+            scores[i] = sentiment["sentiment_score"]
+            confidences[i] = sentiment["confidence"]
+            themes[i] = sentiment["themes"]
+
+        # Clamp once per column instead of per-row min/max calls
+        scores = np.clip(scores, -1.0, 1.0)
+        confidences = np.clip(confidences, 0.0, 1.0)
+        themes = [t if isinstance(t, list) else [] for t in themes]
+
+        sentiment_df = articles_df.reset_index(drop=True)
+        # Backfill optional metadata columns the row-dict path used to default
+        for col in ("content", "url", "author"):
+            if col not in sentiment_df.columns:
+                sentiment_df = sentiment_df.assign(**{col: ""})
+
+        sentiment_df = sentiment_df.assign(
+            sentiment_score=scores,
+            confidence=confidences,
+            themes=themes,
+            # int32 codes against the process-wide vocabulary; downstream
+            # aggregation counts these instead of re-hashing theme strings
+            theme_codes=[encode_themes(t) for t in themes],
+            model_name=self.model,
+            model_version=self.version,
+        )
+
+        # Arrow-backed strings store one contiguous buffer per column
+        # instead of a Python object per cell, cutting memory roughly 3x
+        # on large result sets and letting downstream groupby/dedup work
+        # on Arrow data rather than boxed str objects
+        sentiment_df = sentiment_df.astype({
+            col: "string[pyarrow]"
+            for col in (
+                "ticker", "headline", "content", "source", "url", "author",
+                "model_name", "model_version",
+            )
+            if col in sentiment_df.columns
+        })
         logger.info(f"Completed sentiment analysis for {len(sentiment_df)} articles")
 
         return sentiment_df
 
+    async def _analyze_batch_async(self, articles_df: pd.DataFrame) -> List[Dict]:
+        """
+        Analyze all articles concurrently in multi-article requests.
+
+        Articles are bundled SENTIMENT_BATCH_SIZE at a time into single
+        chat completions, amortizing request latency and prompt overhead;
+        the batched requests themselves are dispatched concurrently.
+
+        Args:
+            articles_df: DataFrame of articles to score
+
+        Returns:
+            List of sentiment dicts (or exceptions) in input row order
+        """
+        batch_size = config.SENTIMENT_BATCH_SIZE
+        semaphore = asyncio.Semaphore(batch_size)
+
+        contents = (
+            articles_df["content"]
+            if "content" in articles_df.columns
+            else [""] * len(articles_df)
+        )
+        rows = [
+            (ticker, headline, content or "")
+            for ticker, headline, content in zip(
+                articles_df["ticker"], articles_df["headline"], contents
+            )
+        ]
+        batches = [rows[i:i + batch_size] for i in range(0, len(rows), batch_size)]
+
+        async def bounded(batch: List[tuple]) -> List[Dict]:
+            async with semaphore:
+                return await self._analyze_article_batch_async(batch)
+
+        batch_results = await asyncio.gather(
+            *(bounded(batch) for batch in batches), return_exceptions=True
+        )
+
+        # Flatten back to one entry per article; a failed batch marks each
+        # of its articles with the exception so callers apply defaults
+        sentiments: List[Dict] = []
+        for batch, result in zip(batches, batch_results):
+            if isinstance(result, Exception):
+                sentiments.extend([result] * len(batch))
+            else:
+                sentiments.extend(result)
+
+        return sentiments
+
+    async def _analyze_article_batch_async(self, batch: List[tuple]) -> List[Dict]:
+        """
+        Score a batch of articles with one chat completion.
+
+        Args:
+            batch: List of (ticker, headline, content) tuples
+
+        Returns:
+            List of raw sentiment dicts, one per article in input order
+        """
+        entries = []
+        for i, (ticker, headline, content) in enumerate(batch, 1):
+            entry = f"Article {i} ({ticker}):\nHeadline: {headline}"
+            if content and len(content) > 10:
+                # Limit to first 1000 chars; slice only when over the cap
+                if len(content) > 1000:
+                    content = content[:1000]
+                entry += f"\nContent: {content}"
+            entries.append(entry)
+
+        prompt = self._BATCH_PROMPT_TEMPLATE.format(articles="\n\n".join(entries))
+
+        try:
+            # Call OpenAI API (temperature=0 for deterministic results)
+            response = await self.async_client.chat.completions.create(
+                model=self.model,
+                messages=[
+                    {"role": "system", "content": "You are a financial sentiment analyst. Analyze news articles and return sentiment scores, confidence levels, and key themes in JSON format."},
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=0,  # Deterministic
+                response_format={"type": "json_object"}
+            )
+
+            results = _BATCH_DECODER.decode(response.choices[0].message.content).results
+
+        except Exception as e:
+            logger.error(f"Error calling OpenAI API: {e}")
+            results = []
+
+        # Align to batch order; missing entries get neutral defaults and
+        # analyze_sentiment_batch clamps columns afterwards
+        sentiments = []
+        for i in range(len(batch)):
+            if i < len(results):
+                item = results[i]
+                sentiments.append({
+                    "sentiment_score": item.sentiment_score,
+                    "confidence": item.confidence,
+                    "themes": item.themes
+                })
+            else:
+                sentiments.append({"sentiment_score": 0.0, "confidence": 0.0, "themes": []})
+
+        return sentiments
+
     def _analyze_single_article(
         self,
         ticker: str,
@@ -134,25 +311,17 @@ class SentimentScorer:
                 response_format={"type": "json_object"}
             )
 
-            # Parse response
-            result_text = response.choices[0].message.content
-            result = json.loads(result_text)
-
-            # Validate and normalize
-            sentiment_score = float(result.get("sentiment_score", 0.0))
-            sentiment_score = max(-1.0, min(1.0, sentiment_score))  # Clamp to [-1, 1]
-
-            confidence = float(result.get("confidence", 0.5))
-            confidence = max(0.0, min(1.0, confidence))  # Clamp to [0, 1]
+            # Parse and shape-validate the response in one C call
+            result = _SENTIMENT_DECODER.decode(response.choices[0].message.content)
 
-            themes = result.get("themes", [])
-            if not isinstance(themes, list):
-                themes = []
+            # Clamp to valid ranges
+            sentiment_score = max(-1.0, min(1.0, result.sentiment_score))
+            confidence = max(0.0, min(1.0, result.confidence))
 
             return {
                 "sentiment_score": sentiment_score,
                 "confidence": confidence,
-                "themes": themes
+                "themes": result.themes
             }
 
         except Exception as e:
@@ -177,24 +346,16 @@ class SentimentScorer:
             Formatted prompt string
         """
         # Use content if available, otherwise just headline
-        text = f"Headline: {headline}"
         if content and len(content) > 10:
-            text += f"\\n\\nContent: {content[:1000]}"  # Limit to first 1000 chars
-
-        prompt = f"""Analyze the sentiment of this financial news article about {ticker}:
-
-{text}
-
-Return a JSON object with exactly these fields:
-{{
-  "sentiment_score": <float between -1.0 and 1.0, where -1.0 is very negative, 0.0 is neutral, 1.0 is very positive>,
-  "confidence": <float between 0.0 and 1.0, indicating how confident you are in the sentiment score>,
-  "themes": [<list of 1-5 key themes or topics, such as "earnings", "product_launch", "lawsuit", "partnership", etc.>]
-}}
-
-Be precise and objective. Focus on the financial implications for the stock price."""
+            # Limit content to first 1000 chars; branch on length first so
+            # the common short case skips the copy a slice would allocate
+            if len(content) > 1000:
+                content = content[:1000]
+            return self._PROMPT_TEMPLATE_WITH_CONTENT.format(
+                ticker=ticker, headline=headline, content=content
+            )
 
-        return prompt
+        return self._PROMPT_TEMPLATE_NO_CONTENT.format(ticker=ticker, headline=headline)
 
 
 if __name__ == "__main__":
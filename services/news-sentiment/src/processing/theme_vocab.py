@@ -0,0 +1,56 @@
+"""
+Process-wide theme vocabulary.
+
+Themes repeat heavily across articles ("earnings", "growth", ...), so
+each one is registered once in a global string -> int32 table and hot
+paths work on small integer codes instead of Python string objects.
+Codes are stable for the lifetime of the process, which lets batches
+scored at different times share one code space; strings are materialized
+again only at output boundaries (database rows, API payloads).
+"""
+from typing import Dict, Iterable, List, Sequence
+
+import numpy as np
+
+# Incrementally grown; _THEME_NAMES[code] inverts _THEME_VOCAB[name]
+_THEME_VOCAB: Dict[str, int] = {}
+_THEME_NAMES: List[str] = []
+
+
+def encode_themes(themes: Sequence[str]) -> np.ndarray:
+    """
+    Map theme strings to int32 codes, registering unseen themes.
+
+    Args:
+        themes: Theme strings for one article (or a flattened batch)
+
+    Returns:
+        int32 array of codes, aligned with the input order
+    """
+    codes = np.empty(len(themes), dtype=np.int32)
+    for i, theme in enumerate(themes):
+        code = _THEME_VOCAB.get(theme)
+        if code is None:
+            code = len(_THEME_NAMES)
+            _THEME_VOCAB[theme] = code
+            _THEME_NAMES.append(theme)
+        codes[i] = code
+    return codes
+
+
+def decode_themes(codes: Iterable[int]) -> List[str]:
+    """
+    Map int32 codes back to theme strings.
+
+    Args:
+        codes: Codes previously produced by encode_themes
+
+    Returns:
+        List of theme strings in code order
+    """
+    return [_THEME_NAMES[code] for code in codes]
+
+
+def vocab_size() -> int:
+    """Number of distinct themes registered so far."""
+    return len(_THEME_NAMES)
@@ -5,18 +5,24 @@ Ensures immutability - only INSERT operations (APPEND-ONLY).
 from datetime import datetime
 from typing import List, Dict
 import sys
+import uuid
 from pathlib import Path
 
 # Add project root to path
 project_root = Path(__file__).resolve().parents[4]
 sys.path.insert(0, str(project_root))
 
-from sqlalchemy import create_engine, func
+from sqlalchemy import Text, bindparam, cast, create_engine, func, select
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.dialects.postgresql import ARRAY, insert
 from loguru import logger
 import pandas as pd
 
+try:
+    import pyarrow as pa
+except ImportError:  # optional: pandas input always works without it
+    pa = None
+
 from api.app.models.news import NewsArticle, NewsSentimentScore, DailySentimentAggregate
 from ..config import config
 
@@ -36,38 +42,73 @@ class NewsDataWriter:
 
         logger.info("Initialized news data writer")
 
-    def write_articles_batch(self, df: pd.DataFrame) -> int:
+    @staticmethod
+    def _as_dataframe(data) -> pd.DataFrame:
+        """Accept either a pandas DataFrame or a PyArrow Table."""
+        if pa is not None and isinstance(data, pa.Table):
+            return data.to_pandas()
+        return data
+
+    @staticmethod
+    def _nullable_str_column(df: pd.DataFrame, column: str) -> list:
+        """Column values as Python strings with missing values mapped to None."""
+        if column not in df.columns:
+            return [None] * len(df)
+        return [str(v) if pd.notna(v) else None for v in df[column]]
+
+    @staticmethod
+    def _pg_text_array(items) -> str:
+        """
+        Preformat a list of strings as a Postgres text[] literal.
+        One formatted string binds per row instead of one adapter call
+        per element; invalid (non-list) values become the empty array.
+        """
+        if not isinstance(items, list):
+            items = []
+        quoted = [
+            '"' + str(item).replace("\\", "\\\\").replace('"', '\\"') + '"'
+            for item in items
+        ]
+        return "{" + ",".join(quoted) + "}"
+
+    @staticmethod
+    def _records_from_columns(columns: dict) -> List[dict]:
+        """Zip prepared column lists into per-row parameter dicts."""
+        names = list(columns)
+        return [dict(zip(names, row)) for row in zip(*columns.values())]
+
+    def write_articles_batch(self, df: "pd.DataFrame | pa.Table") -> int:
         """
         Write news articles in batch (APPEND-ONLY).
         Uses INSERT ... ON CONFLICT DO NOTHING for idempotency.
 
         Args:
-            df: DataFrame with columns: ticker, published_at, headline, content, source, url, author
+            df: DataFrame or PyArrow Table with columns: ticker, published_at,
+                headline, content, source, url, author
 
         Returns:
             Number of records inserted
         """
+        df = self._as_dataframe(df)
         if df.empty:
             logger.warning("No articles to write")
             return 0
 
         try:
-            records = []
-            for _, row in df.iterrows():
-                # Ensure published_at is timezone-aware (UTC)
-                published_at = pd.to_datetime(row["published_at"])
-                if published_at.tzinfo is None:
-                    published_at = published_at.tz_localize('UTC')
-
-                records.append({
-                    "ticker": row["ticker"],
-                    "published_at": published_at,
-                    "headline": str(row["headline"]),
-                    "content": str(row["content"]) if pd.notna(row.get("content")) else None,
-                    "source": str(row["source"]),
-                    "url": str(row["url"]) if pd.notna(row.get("url")) else None,
-                    "author": str(row["author"]) if pd.notna(row.get("author")) else None,
-                })
+            # Ensure published_at is timezone-aware (UTC), whole column at once
+            published_at = pd.to_datetime(df["published_at"])
+            if published_at.dt.tz is None:
+                published_at = published_at.dt.tz_localize('UTC')
+
+            records = self._records_from_columns({
+                "ticker": df["ticker"].astype(str).tolist(),
+                "published_at": published_at.tolist(),
+                "headline": df["headline"].astype(str).tolist(),
+                "content": self._nullable_str_column(df, "content"),
+                "source": df["source"].astype(str).tolist(),
+                "url": self._nullable_str_column(df, "url"),
+                "author": self._nullable_str_column(df, "author"),
+            })
 
             logger.info(
                 f"Prepared {len(records)} news articles "
@@ -77,12 +118,12 @@ class NewsDataWriter:
 
             # Use INSERT ... ON CONFLICT DO NOTHING for idempotency
             # Conflict on unique constraint uq_news_article (ticker, published_at, headline)
-            stmt = insert(NewsArticle.__table__).values(records)
-            stmt = stmt.on_conflict_do_nothing(
+            # Single executemany-style call: one statement, all rows bound at once
+            stmt = insert(NewsArticle.__table__).on_conflict_do_nothing(
                 constraint="uq_news_article"
             )
 
-            result = self.session.execute(stmt)
+            result = self.session.execute(stmt, records)
             self.session.commit()
 
             inserted = result.rowcount
@@ -100,39 +141,46 @@ class NewsDataWriter:
             logger.error(f"Error writing news articles: {e}")
             raise
 
-    def write_sentiment_scores_batch(self, df: pd.DataFrame) -> int:
+    def write_sentiment_scores_batch(self, df: "pd.DataFrame | pa.Table") -> int:
         """
         Write sentiment scores in batch (APPEND-ONLY).
 
         Args:
-            df: DataFrame with columns: ticker, published_at, article_id,
-                sentiment_score, confidence, themes, model_name, model_version
+            df: DataFrame or PyArrow Table with columns: ticker, published_at,
+                article_id, sentiment_score, confidence, themes, model_name, model_version
 
         Returns:
             Number of records inserted
         """
+        df = self._as_dataframe(df)
         if df.empty:
             logger.warning("No sentiment scores to write")
             return 0
 
         try:
-            records = []
-            for _, row in df.iterrows():
-                # Convert themes to list if it's not already
-                themes = row.get("themes", [])
-                if not isinstance(themes, list):
-                    themes = []
-
-                records.append({
-                    "article_id": row["article_id"],
-                    "ticker": row["ticker"],
-                    "published_at": pd.to_datetime(row["published_at"]),
-                    "sentiment_score": float(row["sentiment_score"]),
-                    "confidence": float(row["confidence"]),
-                    "themes": themes,
-                    "model_name": str(row["model_name"]),
-                    "model_version": str(row["model_version"]),
-                })
+            # Preformat themes as Postgres array literals (invalid values
+            # become the empty array)
+            if "themes" in df.columns:
+                themes = [self._pg_text_array(t) for t in df["themes"]]
+            else:
+                themes = ["{}"] * len(df)
+
+            # Bind article ids as 16-byte UUID objects, not 36-char strings
+            article_ids = [
+                v if isinstance(v, uuid.UUID) else uuid.UUID(str(v))
+                for v in df["article_id"]
+            ]
+
+            records = self._records_from_columns({
+                "article_id": article_ids,
+                "ticker": df["ticker"].astype(str).tolist(),
+                "published_at": pd.to_datetime(df["published_at"]).tolist(),
+                "sentiment_score": df["sentiment_score"].astype("float32").tolist(),
+                "confidence": df["confidence"].astype("float32").tolist(),
+                "themes": themes,
+                "model_name": df["model_name"].astype(str).tolist(),
+                "model_version": df["model_version"].astype(str).tolist(),
+            })
 
             logger.info(
                 f"Prepared {len(records)} sentiment scores "
@@ -141,10 +189,22 @@ class NewsDataWriter:
 
             # Use INSERT ... ON CONFLICT DO NOTHING
             # Conflict on unique constraint uq_sentiment_article (article_id)
-            stmt = insert(NewsSentimentScore.__table__).values(records)
-            stmt = stmt.on_conflict_do_nothing(constraint="uq_sentiment_article")
+            stmt = (
+                insert(NewsSentimentScore.__table__)
+                .values({
+                    "article_id": bindparam("article_id"),
+                    "ticker": bindparam("ticker"),
+                    "published_at": bindparam("published_at"),
+                    "sentiment_score": bindparam("sentiment_score"),
+                    "confidence": bindparam("confidence"),
+                    "themes": cast(bindparam("themes"), ARRAY(Text())),
+                    "model_name": bindparam("model_name"),
+                    "model_version": bindparam("model_version"),
+                })
+                .on_conflict_do_nothing(constraint="uq_sentiment_article")
+            )
 
-            result = self.session.execute(stmt)
+            result = self.session.execute(stmt, records)
             self.session.commit()
 
             inserted = result.rowcount
@@ -162,40 +222,42 @@ class NewsDataWriter:
             logger.error(f"Error writing sentiment scores: {e}")
             raise
 
-    def write_daily_aggregates_batch(self, df: pd.DataFrame) -> int:
+    def write_daily_aggregates_batch(self, df: "pd.DataFrame | pa.Table") -> int:
         """
         Write daily sentiment aggregates in batch (APPEND-ONLY).
 
         Args:
-            df: DataFrame with columns: ticker, date, avg_sentiment, weighted_sentiment,
-                article_count, positive_count, neutral_count, negative_count, top_themes
+            df: DataFrame or PyArrow Table with columns: ticker, date, avg_sentiment,
+                weighted_sentiment, article_count, positive_count, neutral_count,
+                negative_count, top_themes
 
         Returns:
             Number of records inserted
         """
+        df = self._as_dataframe(df)
         if df.empty:
             logger.warning("No daily aggregates to write")
             return 0
 
         try:
-            records = []
-            for _, row in df.iterrows():
-                # Convert top_themes to list if it's not already
-                top_themes = row.get("top_themes", [])
-                if not isinstance(top_themes, list):
-                    top_themes = []
-
-                records.append({
-                    "ticker": row["ticker"],
-                    "date": pd.to_datetime(row["date"]).date(),
-                    "avg_sentiment": float(row["avg_sentiment"]),
-                    "weighted_sentiment": float(row["weighted_sentiment"]),
-                    "article_count": int(row["article_count"]),
-                    "positive_count": int(row["positive_count"]),
-                    "neutral_count": int(row["neutral_count"]),
-                    "negative_count": int(row["negative_count"]),
-                    "top_themes": top_themes,
-                })
+            # Preformat top_themes as Postgres array literals (invalid
+            # values become the empty array)
+            if "top_themes" in df.columns:
+                top_themes = [self._pg_text_array(t) for t in df["top_themes"]]
+            else:
+                top_themes = ["{}"] * len(df)
+
+            records = self._records_from_columns({
+                "ticker": df["ticker"].astype(str).tolist(),
+                "date": [d.date() for d in pd.to_datetime(df["date"])],
+                "avg_sentiment": df["avg_sentiment"].astype("float32").tolist(),
+                "weighted_sentiment": df["weighted_sentiment"].astype("float32").tolist(),
+                "article_count": df["article_count"].astype("int32").tolist(),
+                "positive_count": df["positive_count"].astype("int32").tolist(),
+                "neutral_count": df["neutral_count"].astype("int32").tolist(),
+                "negative_count": df["negative_count"].astype("int32").tolist(),
+                "top_themes": top_themes,
+            })
 
             logger.info(
                 f"Prepared {len(records)} daily aggregates "
@@ -205,10 +267,23 @@ class NewsDataWriter:
 
             # Use INSERT ... ON CONFLICT DO NOTHING
             # Conflict on unique constraint uq_daily_sentiment (ticker, date)
-            stmt = insert(DailySentimentAggregate.__table__).values(records)
-            stmt = stmt.on_conflict_do_nothing(constraint="uq_daily_sentiment")
+            stmt = (
+                insert(DailySentimentAggregate.__table__)
+                .values({
+                    "ticker": bindparam("ticker"),
+                    "date": bindparam("date"),
+                    "avg_sentiment": bindparam("avg_sentiment"),
+                    "weighted_sentiment": bindparam("weighted_sentiment"),
+                    "article_count": bindparam("article_count"),
+                    "positive_count": bindparam("positive_count"),
+                    "neutral_count": bindparam("neutral_count"),
+                    "negative_count": bindparam("negative_count"),
+                    "top_themes": cast(bindparam("top_themes"), ARRAY(Text())),
+                })
+                .on_conflict_do_nothing(constraint="uq_daily_sentiment")
+            )
 
-            result = self.session.execute(stmt)
+            result = self.session.execute(stmt, records)
             self.session.commit()
 
             inserted = result.rowcount
@@ -241,23 +316,24 @@ class NewsDataWriter:
             Dict mapping (ticker, published_at, headline) -> article_id
         """
         try:
-            # Query all articles for this ticker (no date filter for robustness)
-            articles = (
-                self.session.query(
+            # Query all articles for this ticker (no date filter for robustness).
+            # Core select yields raw tuples in server-side batches: no ORM
+            # row hydration or attribute descriptors per article.
+            stmt = (
+                select(
                     NewsArticle.ticker,
                     NewsArticle.published_at,
                     NewsArticle.headline,
-                    NewsArticle.id
+                    NewsArticle.id,
                 )
-                .filter(NewsArticle.ticker == ticker)
-                .all()
+                .where(NewsArticle.ticker == ticker)
+                .execution_options(yield_per=1000)
             )
 
             # Create mapping using (ticker, published_at, headline) as key
             mapping = {}
-            for article in articles:
-                key = (article.ticker, article.published_at, article.headline)
-                mapping[key] = str(article.id)
+            for row_ticker, published_at, headline, article_id in self.session.execute(stmt):
+                mapping[(row_ticker, published_at, headline)] = str(article_id)
 
             logger.info(f"Retrieved {len(mapping)} article IDs for {ticker}")
             return mapping
@@ -272,8 +348,8 @@ class NewsDataWriter:
         Returns mapping (ticker, published_at, headline) -> article_id.
         """
         try:
-            rows = (
-                self.session.query(
+            stmt = (
+                select(
                     NewsArticle.ticker,
                     NewsArticle.published_at,
                     NewsArticle.headline,
@@ -283,14 +359,13 @@ class NewsDataWriter:
                     NewsSentimentScore,
                     NewsSentimentScore.article_id == NewsArticle.id,
                 )
-                .filter(NewsArticle.ticker == ticker)
-                .all()
+                .where(NewsArticle.ticker == ticker)
+                .execution_options(yield_per=1000)
             )
 
             mapping = {}
-            for row in rows:
-                key = (row.ticker, row.published_at, row.headline)
-                mapping[key] = str(row.id)
+            for row_ticker, published_at, headline, article_id in self.session.execute(stmt):
+                mapping[(row_ticker, published_at, headline)] = str(article_id)
 
             logger.info(f"Retrieved {len(mapping)} scored article keys for {ticker}")
             return mapping
@@ -2,58 +2,36 @@
 Unit tests for sentiment aggregation.
 """
 import pytest
+import numpy as np
 import pandas as pd
 from datetime import datetime, date
 
-import sys
-from pathlib import Path
-# Add src directory to path
-src_path = Path(__file__).resolve().parent.parent / "src"
-sys.path.insert(0, str(src_path))
-
 from processing.aggregation import SentimentAggregator
+from processing.dedup import dedup_near
 
 
 @pytest.fixture
 def sample_sentiment_data():
-    """Create sample sentiment data for testing."""
-    return pd.DataFrame([
-        {
-            "ticker": "AAPL",
-            "published_at": datetime(2024, 12, 16, 10, 0),
-            "sentiment_score": 0.8,
-            "confidence": 0.9,
-            "themes": ["earnings", "growth"]
-        },
-        {
-            "ticker": "AAPL",
-            "published_at": datetime(2024, 12, 16, 14, 0),
-            "sentiment_score": 0.6,
-            "confidence": 0.8,
-            "themes": ["product_launch", "innovation"]
-        },
-        {
-            "ticker": "AAPL",
-            "published_at": datetime(2024, 12, 16, 18, 0),
-            "sentiment_score": -0.2,
-            "confidence": 0.7,
-            "themes": ["supply_chain", "delays"]
-        },
-        {
-            "ticker": "AAPL",
-            "published_at": datetime(2024, 12, 17, 9, 0),
-            "sentiment_score": -0.5,
-            "confidence": 0.8,
-            "themes": ["production", "delays"]
-        },
-        {
-            "ticker": "TSLA",
-            "published_at": datetime(2024, 12, 16, 11, 0),
-            "sentiment_score": -0.3,
-            "confidence": 0.85,
-            "themes": ["production", "quality"]
-        }
-    ])
+    """Create sample sentiment data for testing (columnar, typed buffers)."""
+    return pd.DataFrame({
+        "ticker": pd.Categorical(["AAPL", "AAPL", "AAPL", "AAPL", "TSLA"]),
+        "published_at": pd.to_datetime([
+            datetime(2024, 12, 16, 10, 0),
+            datetime(2024, 12, 16, 14, 0),
+            datetime(2024, 12, 16, 18, 0),
+            datetime(2024, 12, 17, 9, 0),
+            datetime(2024, 12, 16, 11, 0),
+        ]),
+        "sentiment_score": np.array([0.8, 0.6, -0.2, -0.5, -0.3], dtype=np.float32),
+        "confidence": np.array([0.9, 0.8, 0.7, 0.8, 0.85], dtype=np.float32),
+        "themes": [
+            ["earnings", "growth"],
+            ["product_launch", "innovation"],
+            ["supply_chain", "delays"],
+            ["production", "delays"],
+            ["production", "quality"],
+        ],
+    })
 
 
 class TestSentimentAggregator:
@@ -135,6 +113,21 @@ class TestSentimentAggregator:
         expected_themes = {"earnings", "growth", "product_launch", "innovation", "supply_chain", "delays"}
         assert set(top_themes).issubset(expected_themes)
 
+    def test_aggregate_daily_sentiment_large(self, large_sentiment_data):
+        """Aggregation stays correct at realistic row counts."""
+        aggregator = SentimentAggregator()
+        result = aggregator.aggregate_daily_sentiment(large_sentiment_data)
+
+        # Every article lands in exactly one bucket of one aggregate
+        assert result["article_count"].sum() == len(large_sentiment_data)
+        bucket_total = (
+            result["positive_count"] + result["neutral_count"] + result["negative_count"]
+        )
+        assert (bucket_total == result["article_count"]).all()
+
+        assert result["ticker"].nunique() == 4
+        assert result["avg_sentiment"].between(-1, 1).all()
+
     def test_empty_dataframe(self):
         """Test handling of empty DataFrame."""
         aggregator = SentimentAggregator()
@@ -167,5 +160,58 @@ class TestSentimentAggregator:
             assert ticker_dates == sorted(ticker_dates)
 
 
+class TestNearDedup:
+    """Test suite for MinHash near-duplicate removal."""
+
+    def test_near_dedup_keeps_earliest(self):
+        """Syndicated copies collapse to the earliest-published article."""
+        story = (
+            "Apple reports record quarterly earnings as iPhone sales surge "
+            "past analyst expectations in the holiday quarter"
+        )
+        df = pd.DataFrame({
+            "ticker": ["AAPL", "AAPL", "AAPL"],
+            "published_at": pd.to_datetime([
+                datetime(2024, 12, 16, 14, 0),  # later syndicated copy
+                datetime(2024, 12, 16, 10, 0),  # original
+                datetime(2024, 12, 16, 12, 0),  # unrelated story
+            ]),
+            "headline": [
+                story + " today",
+                story,
+                "Regulators open antitrust inquiry into app store practices",
+            ],
+            "content": ["", "", ""],
+        })
+
+        result = dedup_near(df)
+
+        assert len(result) == 2
+        kept_times = result["published_at"].tolist()
+        assert datetime(2024, 12, 16, 10, 0) in kept_times
+        assert datetime(2024, 12, 16, 14, 0) not in kept_times
+
+    def test_near_dedup_distinct_articles_untouched(self):
+        """Genuinely different articles all survive."""
+        df = pd.DataFrame({
+            "ticker": ["AAPL", "AAPL", "TSLA"],
+            "published_at": pd.to_datetime([
+                datetime(2024, 12, 16, 10, 0),
+                datetime(2024, 12, 16, 11, 0),
+                datetime(2024, 12, 16, 12, 0),
+            ]),
+            "headline": [
+                "Apple reports record quarterly earnings on strong iPhone sales",
+                "Supply chain constraints delay new MacBook shipments until spring",
+                "Tesla opens new gigafactory in Austin amid production ramp",
+            ],
+            "content": ["", "", ""],
+        })
+
+        result = dedup_near(df)
+
+        assert len(result) == 3
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
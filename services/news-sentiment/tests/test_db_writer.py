@@ -2,17 +2,12 @@
 Unit tests for news database writer.
 """
 import pytest
+import numpy as np
 import pandas as pd
 from datetime import datetime, date
 from unittest.mock import Mock, patch, MagicMock
 from uuid import uuid4
 
-import sys
-from pathlib import Path
-# Add src directory to path
-src_path = Path(__file__).resolve().parent.parent / "src"
-sys.path.insert(0, str(src_path))
-
 from src.storage.db_writer import NewsDataWriter
 
 
@@ -34,95 +29,69 @@ def mock_db_session():
 
 @pytest.fixture
 def sample_articles():
-    """Create sample articles DataFrame."""
-    return pd.DataFrame([
-        {
-            "ticker": "AAPL",
-            "published_at": datetime(2024, 12, 16, 10, 0),
-            "headline": "Apple reports record earnings",
-            "content": "Strong iPhone sales drive growth",
-            "source": "Reuters",
-            "url": "https://example.com/article1",
-            "author": "John Doe"
-        },
-        {
-            "ticker": "TSLA",
-            "published_at": datetime(2024, 12, 16, 11, 0),
-            "headline": "Tesla production update",
-            "content": "New factory coming online",
-            "source": "Bloomberg",
-            "url": "https://example.com/article2",
-            "author": "Jane Smith"
-        },
-        {
-            "ticker": "MSFT",
-            "published_at": datetime(2024, 12, 16, 12, 0),
-            "headline": "Microsoft AI announcement",
-            "content": None,  # Test null content
-            "source": "TechCrunch",
-            "url": None,  # Test null URL
-            "author": None  # Test null author
-        }
-    ])
+    """Create sample articles DataFrame (columnar, typed buffers)."""
+    return pd.DataFrame({
+        "ticker": pd.Categorical(["AAPL", "TSLA", "MSFT"]),
+        "published_at": pd.to_datetime([
+            datetime(2024, 12, 16, 10, 0),
+            datetime(2024, 12, 16, 11, 0),
+            datetime(2024, 12, 16, 12, 0),
+        ]),
+        "headline": [
+            "Apple reports record earnings",
+            "Tesla production update",
+            "Microsoft AI announcement",
+        ],
+        "content": [
+            "Strong iPhone sales drive growth",
+            "New factory coming online",
+            None,  # Test null content
+        ],
+        "source": pd.Categorical(["Reuters", "Bloomberg", "TechCrunch"]),
+        "url": [
+            "https://example.com/article1",
+            "https://example.com/article2",
+            None,  # Test null URL
+        ],
+        "author": ["John Doe", "Jane Smith", None],  # Test null author
+    })
 
 
 @pytest.fixture
 def sample_sentiment_scores():
-    """Create sample sentiment scores DataFrame."""
-    article_id1 = str(uuid4())
-    article_id2 = str(uuid4())
-
-    return pd.DataFrame([
-        {
-            "article_id": article_id1,
-            "ticker": "AAPL",
-            "published_at": datetime(2024, 12, 16, 10, 0),
-            "sentiment_score": 0.8,
-            "confidence": 0.9,
-            "themes": ["earnings", "growth"],
-            "model_name": "gpt-4o-mini",
-            "model_version": "1.0.0"
-        },
-        {
-            "article_id": article_id2,
-            "ticker": "TSLA",
-            "published_at": datetime(2024, 12, 16, 11, 0),
-            "sentiment_score": -0.3,
-            "confidence": 0.7,
-            "themes": ["production", "delays"],
-            "model_name": "gpt-4o-mini",
-            "model_version": "1.0.0"
-        }
-    ])
+    """Create sample sentiment scores DataFrame (columnar, typed buffers)."""
+    return pd.DataFrame({
+        "article_id": [uuid4(), uuid4()],
+        "ticker": pd.Categorical(["AAPL", "TSLA"]),
+        "published_at": pd.to_datetime([
+            datetime(2024, 12, 16, 10, 0),
+            datetime(2024, 12, 16, 11, 0),
+        ]),
+        "sentiment_score": np.array([0.8, -0.3], dtype=np.float32),
+        "confidence": np.array([0.9, 0.7], dtype=np.float32),
+        "themes": [["earnings", "growth"], ["production", "delays"]],
+        "model_name": pd.Categorical(["gpt-4o-mini", "gpt-4o-mini"]),
+        "model_version": ["1.0.0", "1.0.0"],
+    })
 
 
 @pytest.fixture
 def sample_daily_aggregates():
-    """Create sample daily aggregates DataFrame."""
-    return pd.DataFrame([
-        {
-            "ticker": "AAPL",
-            "date": date(2024, 12, 16),
-            "avg_sentiment": 0.45,
-            "weighted_sentiment": 0.52,
-            "article_count": 10,
-            "positive_count": 7,
-            "neutral_count": 2,
-            "negative_count": 1,
-            "top_themes": ["earnings", "innovation", "growth"]
-        },
-        {
-            "ticker": "TSLA",
-            "date": date(2024, 12, 16),
-            "avg_sentiment": -0.15,
-            "weighted_sentiment": -0.10,
-            "article_count": 8,
-            "positive_count": 3,
-            "neutral_count": 2,
-            "negative_count": 3,
-            "top_themes": ["production", "regulatory", "competition"]
-        }
-    ])
+    """Create sample daily aggregates DataFrame (columnar, typed buffers)."""
+    return pd.DataFrame({
+        "ticker": pd.Categorical(["AAPL", "TSLA"]),
+        "date": [date(2024, 12, 16), date(2024, 12, 16)],
+        "avg_sentiment": np.array([0.45, -0.15], dtype=np.float32),
+        "weighted_sentiment": np.array([0.52, -0.10], dtype=np.float32),
+        "article_count": np.array([10, 8], dtype=np.int32),
+        "positive_count": np.array([7, 3], dtype=np.int32),
+        "neutral_count": np.array([2, 2], dtype=np.int32),
+        "negative_count": np.array([1, 3], dtype=np.int32),
+        "top_themes": [
+            ["earnings", "innovation", "growth"],
+            ["production", "regulatory", "competition"],
+        ],
+    })
 
 
 class TestNewsDataWriter:
@@ -160,6 +129,19 @@ class TestNewsDataWriter:
         # Should return number of inserted rows
         assert result == 3
 
+    def test_write_articles_batch_accepts_arrow_table(self, mock_db_session, sample_articles):
+        """A PyArrow Table input writes the same rows as the DataFrame."""
+        pa = pytest.importorskip("pyarrow")
+        writer = NewsDataWriter()
+
+        table = pa.Table.from_pandas(sample_articles)
+        mock_db_session.execute.return_value.rowcount = len(sample_articles)
+
+        result = writer.write_articles_batch(table)
+
+        assert result == 3
+        assert mock_db_session.commit.called
+
     def test_write_articles_batch_handles_null_values(self, mock_db_session):
         """Test handling of null/None values in articles."""
         writer = NewsDataWriter()
@@ -244,7 +226,7 @@ class TestNewsDataWriter:
 
         df_invalid_themes = pd.DataFrame([
             {
-                "article_id": str(uuid4()),
+                "article_id": uuid4(),
                 "ticker": "AAPL",
                 "published_at": datetime(2024, 12, 16, 10, 0),
                 "sentiment_score": 0.5,
@@ -258,8 +240,10 @@ class TestNewsDataWriter:
         mock_db_session.execute.return_value.rowcount = 1
         result = writer.write_sentiment_scores_batch(df_invalid_themes)
 
-        # Should convert invalid themes to empty list and succeed
+        # Should fall back to the empty array literal and succeed
         assert result == 1
+        records = mock_db_session.execute.call_args[0][1]
+        assert records[0]["themes"] == "{}"
 
     def test_write_daily_aggregates_batch_empty_df(self, mock_db_session):
         """Test handling of empty daily aggregates DataFrame."""
@@ -302,41 +286,36 @@ class TestNewsDataWriter:
         mock_db_session.execute.return_value.rowcount = 1
         result = writer.write_daily_aggregates_batch(df_invalid_themes)
 
-        # Should convert invalid themes to empty list and succeed
+        # Should fall back to the empty array literal and succeed
         assert result == 1
+        records = mock_db_session.execute.call_args[0][1]
+        assert records[0]["top_themes"] == "{}"
 
     def test_get_article_ids_for_ticker(self, mock_db_session):
         """Test retrieving article IDs for a ticker."""
         writer = NewsDataWriter()
 
-        # Mock query result
-        mock_article_1 = MagicMock()
-        mock_article_1.ticker = "AAPL"
-        mock_article_1.published_at = datetime(2024, 12, 16, 10, 0)
-        mock_article_1.headline = "Test headline 1"
-        mock_article_1.id = uuid4()
-
-        mock_article_2 = MagicMock()
-        mock_article_2.ticker = "AAPL"
-        mock_article_2.published_at = datetime(2024, 12, 16, 11, 0)
-        mock_article_2.headline = "Test headline 2"
-        mock_article_2.id = uuid4()
-
-        mock_query = mock_db_session.query.return_value
-        mock_query.filter.return_value.all.return_value = [mock_article_1, mock_article_2]
+        # Raw tuple rows, as yielded by the Core select
+        dt1 = datetime(2024, 12, 16, 10, 0)
+        dt2 = datetime(2024, 12, 16, 11, 0)
+        id1, id2 = uuid4(), uuid4()
+        mock_db_session.execute.return_value = [
+            ("AAPL", dt1, "Test headline 1", id1),
+            ("AAPL", dt2, "Test headline 2", id2),
+        ]
 
         result = writer.get_article_ids_for_ticker("AAPL")
 
         assert len(result) == 2
-        assert ("AAPL", mock_article_1.published_at, "Test headline 1") in result
-        assert ("AAPL", mock_article_2.published_at, "Test headline 2") in result
+        assert result[("AAPL", dt1, "Test headline 1")] == str(id1)
+        assert result[("AAPL", dt2, "Test headline 2")] == str(id2)
 
     def test_get_article_ids_for_ticker_database_error(self, mock_db_session):
         """Test handling of database errors when retrieving article IDs."""
         writer = NewsDataWriter()
 
-        # Make query raise an exception
-        mock_db_session.query.side_effect = Exception("Query error")
+        # Make execute raise an exception
+        mock_db_session.execute.side_effect = Exception("Query error")
 
         with pytest.raises(Exception) as exc_info:
             writer.get_article_ids_for_ticker("AAPL")
@@ -370,7 +349,7 @@ class TestNewsDataWriter:
 
         df_with_strings = pd.DataFrame([
             {
-                "article_id": str(uuid4()),
+                "article_id": uuid4(),
                 "ticker": "AAPL",
                 "published_at": datetime(2024, 12, 16, 10, 0),
                 "sentiment_score": "0.8",  # String instead of float
@@ -7,40 +7,80 @@ from datetime import datetime
 from unittest.mock import Mock, patch, MagicMock
 import json
 
-import sys
-from pathlib import Path
-# Add src directory to path
-src_path = Path(__file__).resolve().parent.parent / "src"
-sys.path.insert(0, str(src_path))
-
-from src.processing.sentiment_scoring import SentimentScorer
+from src.processing.sentiment_scoring import SentimentScorer, _get_client, _get_async_client
+
+
+@pytest.fixture(autouse=True)
+def _reset_client_cache():
+    """Clear the cached module-level clients so patched constructors apply."""
+    _get_client.cache_clear()
+    _get_async_client.cache_clear()
+    yield
+    _get_client.cache_clear()
+    _get_async_client.cache_clear()
+
+
+def _build_mock_openai():
+    """Build paired sync/async client mocks sharing one create mock."""
+    mock_client = MagicMock()
+
+    # Create mock response. The payload serves both prompt shapes:
+    # top-level fields for _analyze_single_article and a results
+    # array for the batched multi-article requests
+    entry = {
+        "sentiment_score": 0.8,
+        "confidence": 0.9,
+        "themes": ["earnings", "growth"]
+    }
+    mock_response = MagicMock()
+    mock_response.choices = [MagicMock()]
+    mock_response.choices[0].message.content = json.dumps({
+        **entry,
+        "results": [entry] * 10,
+    })
+
+    mock_client.chat.completions.create.return_value = mock_response
+
+    # Async client delegates to the same sync mock so tests configuring
+    # return_value / side_effect cover both code paths
+    async def async_create(*args, **kwargs):
+        return mock_client.chat.completions.create(*args, **kwargs)
+
+    mock_async_client = MagicMock()
+    mock_async_client.chat.completions.create = async_create
+    return mock_client, mock_async_client
 
 
 @pytest.fixture
 def mock_openai_client():
-    """Create a mock OpenAI client."""
-    with patch('src.processing.sentiment_scoring.OpenAI') as mock_openai:
-        # Create mock client instance
-        mock_client = MagicMock()
+    """Function-scoped mocks for tests that reconfigure return_value/side_effect."""
+    with patch('src.processing.sentiment_scoring.OpenAI') as mock_openai, \
+         patch('src.processing.sentiment_scoring.AsyncOpenAI') as mock_async_openai:
+        mock_client, mock_async_client = _build_mock_openai()
         mock_openai.return_value = mock_client
+        mock_async_openai.return_value = mock_async_client
 
-        # Create mock response
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = json.dumps({
-            "sentiment_score": 0.8,
-            "confidence": 0.9,
-            "themes": ["earnings", "growth"]
-        })
+        yield mock_client
 
-        mock_client.chat.completions.create.return_value = mock_response
+
+@pytest.fixture(scope="module")
+def mock_openai_client_module():
+    """
+    Module-scoped variant built once for the whole file; only for tests
+    that read the default payload and never touch return_value/side_effect.
+    """
+    with patch('src.processing.sentiment_scoring.OpenAI') as mock_openai, \
+         patch('src.processing.sentiment_scoring.AsyncOpenAI') as mock_async_openai:
+        mock_client, mock_async_client = _build_mock_openai()
+        mock_openai.return_value = mock_client
+        mock_async_openai.return_value = mock_async_client
 
         yield mock_client
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_articles():
-    """Create sample articles for testing."""
+    """Create sample articles once per module (tests only read them)."""
     return pd.DataFrame([
         {
             "ticker": "AAPL",
@@ -75,7 +115,7 @@ def sample_articles():
 class TestSentimentScorer:
     """Test suite for SentimentScorer."""
 
-    def test_initialization(self, mock_openai_client):
+    def test_initialization(self, mock_openai_client_module):
         """Test scorer initialization."""
         scorer = SentimentScorer()
 
@@ -84,7 +124,7 @@ class TestSentimentScorer:
         assert scorer.version == "1.0.0"
         assert scorer.client is not None
 
-    def test_analyze_sentiment_batch_empty_df(self, mock_openai_client):
+    def test_analyze_sentiment_batch_empty_df(self, mock_openai_client_module):
         """Test handling of empty DataFrame."""
         scorer = SentimentScorer()
         empty_df = pd.DataFrame()
@@ -93,7 +133,7 @@ class TestSentimentScorer:
 
         assert result.empty
 
-    def test_analyze_sentiment_batch_success(self, mock_openai_client, sample_articles):
+    def test_analyze_sentiment_batch_success(self, mock_openai_client_module, sample_articles):
         """Test successful sentiment analysis."""
         scorer = SentimentScorer()
 
@@ -118,6 +158,26 @@ class TestSentimentScorer:
         assert all(result["model_name"] == "gpt-4o-mini")
         assert all(result["model_version"] == "1.0.0")
 
+    def test_analyze_sentiment_batch_single_request(self, mock_openai_client, sample_articles):
+        """A batch within SENTIMENT_BATCH_SIZE goes out as one API call."""
+        mock_openai_client.chat.completions.create.return_value.choices[0].message.content = json.dumps({
+            "results": [
+                {"sentiment_score": 0.5, "confidence": 0.9, "themes": ["earnings"]},
+                {"sentiment_score": -0.2, "confidence": 0.8, "themes": ["delays"]},
+                {"sentiment_score": 0.1, "confidence": 0.7, "themes": []},
+            ]
+        })
+
+        scorer = SentimentScorer()
+        result = scorer.analyze_sentiment_batch(sample_articles)
+
+        # 3 articles with batch size 10 -> a single bundled request
+        assert mock_openai_client.chat.completions.create.call_count == 1
+
+        # Scores map back to articles in input order
+        assert result["sentiment_score"].tolist() == pytest.approx([0.5, -0.2, 0.1])
+        assert result["themes"].tolist() == [["earnings"], ["delays"], []]
+
     def test_analyze_sentiment_batch_with_api_error(self, mock_openai_client, sample_articles):
         """Test handling of API errors."""
         scorer = SentimentScorer()
@@ -133,7 +193,7 @@ class TestSentimentScorer:
         assert all(result["confidence"] == 0.0)
         assert all(result["themes"].apply(lambda x: len(x) == 0))
 
-    def test_analyze_single_article_positive_sentiment(self, mock_openai_client):
+    def test_analyze_single_article_positive_sentiment(self, mock_openai_client_module):
         """Test analyzing a positive article."""
         scorer = SentimentScorer()
 
@@ -253,7 +313,7 @@ class TestSentimentScorer:
         result = scorer._analyze_single_article("AAPL", "Test", "Test")
         assert result["themes"] == []
 
-    def test_create_prompt_with_content(self, mock_openai_client):
+    def test_create_prompt_with_content(self, mock_openai_client_module):
         """Test prompt creation with content."""
         scorer = SentimentScorer()
 
@@ -270,7 +330,7 @@ class TestSentimentScorer:
         assert "confidence" in prompt
         assert "themes" in prompt
 
-    def test_create_prompt_without_content(self, mock_openai_client):
+    def test_create_prompt_without_content(self, mock_openai_client_module):
         """Test prompt creation without content."""
         scorer = SentimentScorer()
 
@@ -286,7 +346,7 @@ class TestSentimentScorer:
         # Should not include content section for empty content
         assert "Content:" not in prompt
 
-    def test_create_prompt_truncates_long_content(self, mock_openai_client):
+    def test_create_prompt_truncates_long_content(self, mock_openai_client_module):
         """Test that very long content is truncated."""
         scorer = SentimentScorer()
 
@@ -302,7 +362,7 @@ class TestSentimentScorer:
         # Check that the full content is not in the prompt
         assert len(prompt) < len(long_content) + 500  # Should be much shorter than full content
 
-    def test_analyze_sentiment_preserves_article_metadata(self, mock_openai_client, sample_articles):
+    def test_analyze_sentiment_preserves_article_metadata(self, mock_openai_client_module, sample_articles):
         """Test that article metadata is preserved in results."""
         scorer = SentimentScorer()
 
@@ -327,7 +387,8 @@ class TestSentimentScorer:
 
             # Should not raise an error during initialization
             # (OpenAI client will handle missing key on first API call)
-            with patch('src.processing.sentiment_scoring.OpenAI'):
+            with patch('src.processing.sentiment_scoring.OpenAI'), \
+                 patch('src.processing.sentiment_scoring.AsyncOpenAI'):
                 scorer = SentimentScorer()
                 assert scorer is not None
 
@@ -7,12 +7,6 @@ import pandas as pd
 from datetime import datetime, date
 from unittest.mock import Mock, patch
 
-import sys
-from pathlib import Path
-# Add src directory to path
-src_path = Path(__file__).resolve().parent.parent / "src"
-sys.path.insert(0, str(src_path))
-
 from processing.aggregation import SentimentAggregator
 
 
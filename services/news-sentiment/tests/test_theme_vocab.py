@@ -0,0 +1,40 @@
+"""Tests for the process-wide theme vocabulary."""
+import numpy as np
+
+from src.processing.theme_vocab import decode_themes, encode_themes, vocab_size
+
+
+class TestThemeVocab:
+    """Test theme string <-> int32 code mapping."""
+
+    def test_encode_decode_roundtrip(self):
+        """Codes decode back to the original strings in order."""
+        themes = ["earnings", "growth", "earnings"]
+        codes = encode_themes(themes)
+
+        assert codes.dtype == np.int32
+        assert codes[0] == codes[2]  # same theme, same code
+        assert decode_themes(codes) == themes
+
+    def test_codes_stable_across_calls(self):
+        """A theme keeps its code when encoded again in a later batch."""
+        first = encode_themes(["lawsuit", "partnership"])
+        second = encode_themes(["partnership", "lawsuit", "buyback"])
+
+        assert second[0] == first[1]
+        assert second[1] == first[0]
+
+    def test_vocab_grows_only_on_new_themes(self):
+        """Re-encoding known themes does not grow the vocabulary."""
+        encode_themes(["dividends"])
+        size = vocab_size()
+        encode_themes(["dividends", "dividends"])
+
+        assert vocab_size() == size
+
+    def test_encode_empty(self):
+        """Empty theme lists encode to an empty int32 array."""
+        codes = encode_themes([])
+
+        assert len(codes) == 0
+        assert codes.dtype == np.int32
@@ -1,75 +1,71 @@
 """
 Shared schemas for the Stock AI Platform.
 All schemas are immutable (frozen=True) to ensure data integrity.
-"""
 
-from .base import (
-    TimestampedSchema,
-    StockSymbol,
-    DateRange,
-    Recommendation,
-    Signal,
-    RiskLevel,
-    PositionSize,
-)
-from .market_data import (
-    OHLCVData,
-    TechnicalIndicators,
-    StockInfo,
-    MarketDataBatch,
-)
-from .news_sentiment import (
-    NewsArticle,
-    NewsSentiment,
-    DailySentimentAggregate,
-    NewsBatch,
-)
-from .feature_store import (
-    FeatureSnapshot,
-    FeatureSnapshotMetadata,
-    FeatureValidation,
-    FeatureQuery,
-    FeatureBatch,
-)
-from .agents import (
-    AgentOutput,
-    TechnicalAgentOutput,
-    SentimentAgentOutput,
-    RiskAgentOutput,
-    StockRecommendation,
-    AgentExecutionLog,
-)
+Submodules load lazily (PEP 562): `from shared.schemas import Signal`
+pulls in only base.py, not the whole market-data/news/feature-store
+schema tree, keeping startup cheap for small-import scripts.
+"""
+import importlib
 
-__all__ = [
+_LAZY = {
     # Base
-    "TimestampedSchema",
-    "StockSymbol",
-    "DateRange",
-    "Recommendation",
-    "Signal",
-    "RiskLevel",
-    "PositionSize",
+    "TimestampedSchema": "base",
+    "TimestampedStruct": "base",
+    "StockSymbol": "base",
+    "DateRange": "base",
+    "Recommendation": "base",
+    "Signal": "base",
+    "SignalCode": "base",
+    "RiskLevel": "base",
+    "PositionSize": "base",
+    "load_trusted": "base",
+    "BatchMetadata": "base",
     # Market Data
-    "OHLCVData",
-    "TechnicalIndicators",
-    "StockInfo",
-    "MarketDataBatch",
+    "OHLCVData": "market_data",
+    "OHLCVFrame": "market_data",
+    "TechnicalIndicators": "market_data",
+    "StockInfo": "market_data",
+    "MarketDataBatch": "market_data",
     # News & Sentiment
-    "NewsArticle",
-    "NewsSentiment",
-    "DailySentimentAggregate",
-    "NewsBatch",
+    "NewsArticle": "news_sentiment",
+    "NewsSentiment": "news_sentiment",
+    "DailySentimentAggregate": "news_sentiment",
+    "NewsBatch": "news_sentiment",
+    # Themes
+    "ThemeDictionary": "themes",
+    "THEMES": "themes",
     # Feature Store
-    "FeatureSnapshot",
-    "FeatureSnapshotMetadata",
-    "FeatureValidation",
-    "FeatureQuery",
-    "FeatureBatch",
+    "FeatureSnapshot": "feature_store",
+    "TechnicalFeatureVector": "feature_store",
+    "SentimentFeatureVector": "feature_store",
+    "FeatureSnapshotMetadata": "feature_store",
+    "FeatureValidation": "feature_store",
+    "FeatureQuery": "feature_store",
+    "FeatureBatchQuery": "feature_store",
+    "FeatureBatch": "feature_store",
     # Agents
-    "AgentOutput",
-    "TechnicalAgentOutput",
-    "SentimentAgentOutput",
-    "RiskAgentOutput",
-    "StockRecommendation",
-    "AgentExecutionLog",
-]
+    "AgentOutput": "agents",
+    "TechnicalAgentOutput": "agents",
+    "SentimentAgentOutput": "agents",
+    "RiskAgentOutput": "agents",
+    "StockRecommendation": "agents",
+    "AgentExecutionLog": "agents",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str):
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{module_name}", __name__)
+    value = getattr(module, name)
+    # Cache on the package so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(__all__)
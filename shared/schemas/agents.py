@@ -4,111 +4,92 @@ These schemas ensure agent outputs are structured and auditable.
 
 CRITICAL: Agents never run in API requests. These schemas represent
 pre-computed, versioned results stored in the database.
+
+These are msgspec Structs rather than Pydantic models: agent outputs are
+created per recommendation per ticker in hot loops, where msgspec's
+C-level construction and JSON codecs are an order of magnitude cheaper
+than Pydantic validation. Structs are also __slots__-based (no per-instance
+__dict__), which matters at backfill scale: one instance per ticker per day
+per agent type. Range constraints are enforced on decode.
 """
 from datetime import date, datetime
-from typing import Any, Optional
-from pydantic import BaseModel, ConfigDict, Field
-from .base import TimestampedSchema, Signal, RiskLevel, PositionSize, Recommendation
+from typing import Annotated, Any, Optional
+
+import msgspec
+from msgspec import Meta
+
+from .base import TimestampedStruct, Signal, RiskLevel, PositionSize, Recommendation
 
+# Score/confidence values constrained to the unit interval
+UnitFloat = Annotated[float, Meta(ge=0.0, le=1.0)]
 
-class AgentOutput(TimestampedSchema):
+
+class AgentOutput(TimestampedStruct, kw_only=True):
     """
     Base schema for all agent outputs.
     Every agent decision is versioned and traceable.
     """
 
-    output_id: str = Field(..., description="Unique output identifier (UUID)")
-    agent_type: str = Field(..., description="Type of agent (technical, sentiment, risk, etc.)")
-    ticker: str = Field(..., description="Stock ticker analyzed")
-    as_of_date: date = Field(..., description="Analysis date")
+    output_id: str  # Unique output identifier (UUID)
+    agent_type: str  # Type of agent (technical, sentiment, risk, etc.)
+    ticker: str  # Stock ticker analyzed
+    as_of_date: date  # Analysis date
 
     # Traceability
-    feature_snapshot_id: str = Field(
-        ...,
-        description="Feature snapshot this analysis is based on"
-    )
-    model_version: str = Field(..., description="Agent model version")
-    prompt_hash: str = Field(..., description="Hash of prompt used (for reproducibility)")
-
-    model_config = ConfigDict(frozen=True)
+    feature_snapshot_id: str  # Feature snapshot this analysis is based on
+    model_version: str  # Agent model version
+    prompt_hash: str  # Hash of prompt used (for reproducibility)
 
 
-class TechnicalAgentOutput(AgentOutput):
+class TechnicalAgentOutput(AgentOutput, kw_only=True):
     """Output from Technical Analyst agent."""
 
-    agent_type: str = Field(default="technical", frozen=True)
+    agent_type: str = "technical"
 
-    signal: Signal = Field(..., description="Technical signal (BULLISH/NEUTRAL/BEARISH)")
-    strength: float = Field(
-        ...,
-        ge=0.0,
-        le=1.0,
-        description="Signal strength/confidence"
-    )
+    signal: Signal  # Technical signal (BULLISH/NEUTRAL/BEARISH)
+    strength: UnitFloat  # Signal strength/confidence
 
-    reasoning: list[str] = Field(
-        ...,
-        description="List of technical reasons for this signal"
-    )
+    # List of technical reasons for this signal
+    reasoning: list[str]
 
-    key_indicators: dict[str, Any] = Field(
-        default_factory=dict,
-        description="Key technical indicators that drove the decision"
-    )
+    # Key technical indicators that drove the decision
+    key_indicators: dict[str, Any] = msgspec.field(default_factory=dict)
 
-    model_config = ConfigDict(frozen=True)
 
-
-class SentimentAgentOutput(AgentOutput):
+class SentimentAgentOutput(AgentOutput, kw_only=True):
     """Output from Sentiment Analyst agent."""
 
-    agent_type: str = Field(default="sentiment", frozen=True)
-
-    signal: Signal = Field(..., description="Sentiment signal")
-    strength: float = Field(..., ge=0.0, le=1.0, description="Sentiment strength")
+    agent_type: str = "sentiment"
 
-    reasoning: list[str] = Field(
-        ...,
-        description="Key sentiment drivers"
-    )
+    signal: Signal  # Sentiment signal
+    strength: UnitFloat  # Sentiment strength
 
-    top_themes: list[str] = Field(
-        default_factory=list,
-        description="Most important themes from news"
-    )
+    # Key sentiment drivers
+    reasoning: list[str]
 
-    article_count: int = Field(..., ge=0, description="Number of articles analyzed")
+    # Most important themes from news
+    top_themes: list[str] = msgspec.field(default_factory=list)
 
-    model_config = ConfigDict(frozen=True)
+    # Number of articles analyzed
+    article_count: Annotated[int, Meta(ge=0)]
 
 
-class RiskAgentOutput(AgentOutput):
+class RiskAgentOutput(AgentOutput, kw_only=True):
     """Output from Risk Manager agent."""
 
-    agent_type: str = Field(default="risk", frozen=True)
-
-    risk_level: RiskLevel = Field(..., description="Overall risk assessment")
-    risk_score: float = Field(
-        ...,
-        ge=0.0,
-        le=1.0,
-        description="Quantitative risk score"
-    )
+    agent_type: str = "risk"
 
-    risk_factors: list[str] = Field(
-        ...,
-        description="Identified risk factors"
-    )
+    risk_level: RiskLevel  # Overall risk assessment
+    risk_score: UnitFloat  # Quantitative risk score
 
-    position_sizing: PositionSize = Field(
-        ...,
-        description="Recommended position size given risk"
-    )
+    # Identified risk factors
+    risk_factors: list[str]
 
-    model_config = ConfigDict(frozen=True)
+    # Recommended position size given risk
+    position_sizing: PositionSize
 
 
-class StockRecommendation(TimestampedSchema):
+class StockRecommendation(TimestampedStruct, kw_only=True):
     """
     Final synthesized recommendation (from Portfolio Synthesizer agent).
     This is what the API serves to users.
@@ -116,70 +97,55 @@ class StockRecommendation(TimestampedSchema):
     CRITICAL: This is pre-computed offline, never generated on-demand.
     """
 
-    recommendation_id: str = Field(..., description="Unique recommendation ID (UUID)")
-    ticker: str = Field(..., description="Stock ticker")
-    as_of_date: date = Field(..., description="Recommendation date")
+    recommendation_id: str  # Unique recommendation ID (UUID)
+    ticker: str  # Stock ticker
+    as_of_date: date  # Recommendation date
 
     # Recommendation
-    recommendation: Recommendation = Field(
-        ...,
-        description="Final recommendation (STRONG_BUY, BUY, HOLD, SELL, STRONG_SELL)"
-    )
-    confidence: float = Field(
-        ...,
-        ge=0.0,
-        le=1.0,
-        description="Overall confidence in recommendation"
-    )
+    recommendation: Recommendation  # STRONG_BUY, BUY, HOLD, SELL, STRONG_SELL
+    confidence: UnitFloat  # Overall confidence in recommendation
 
     # Supporting signals from individual agents
-    technical_signal: Signal = Field(..., description="Technical agent signal")
-    sentiment_signal: Signal = Field(..., description="Sentiment agent signal")
-    risk_level: RiskLevel = Field(..., description="Risk assessment")
+    technical_signal: Signal
+    sentiment_signal: Signal
+    risk_level: RiskLevel
 
-    # Explanation (for UI)
-    rationale: dict[str, list[str]] = Field(
-        ...,
-        description="Structured explanation: {technical: [...], sentiment: [...], risk: [...]}"
-    )
+    # Explanation (for UI): {technical: [...], sentiment: [...], risk: [...]}
+    rationale: dict[str, list[str]]
 
     # Position sizing
-    position_size: PositionSize = Field(..., description="Recommended position size")
-    time_horizon: str = Field(..., description="Suggested holding period")
+    position_size: PositionSize
+    time_horizon: str  # Suggested holding period
 
     # Traceability
-    agent_outputs: dict[str, str] = Field(
-        ...,
-        description="Map of agent_type -> output_id for full audit trail"
-    )
-    feature_snapshot_id: str = Field(
-        ...,
-        description="Feature snapshot all agents used"
-    )
-    model_version: str = Field(..., description="Synthesizer model version")
+    agent_outputs: dict[str, str]  # Map of agent_type -> output_id for audit trail
+    feature_snapshot_id: str  # Feature snapshot all agents used
+    model_version: str  # Synthesizer model version
 
-    model_config = ConfigDict(frozen=True)
 
-
-class AgentExecutionLog(TimestampedSchema):
+class AgentExecutionLog(TimestampedStruct, kw_only=True):
     """
     Log of agent execution for monitoring and debugging.
     Tracks when agents ran, how long they took, etc.
     """
 
-    execution_id: str = Field(..., description="Execution run ID")
-    agent_type: str = Field(..., description="Agent type")
-    ticker: str = Field(..., description="Stock analyzed")
-    as_of_date: date = Field(..., description="Analysis date")
+    execution_id: str  # Execution run ID
+    agent_type: str  # Agent type
+    ticker: str  # Stock analyzed
+    as_of_date: date  # Analysis date
+
+    started_at: datetime  # Execution start time
+    completed_at: datetime  # Execution completion time
+    duration_seconds: Annotated[float, Meta(ge=0)]  # Execution duration
 
-    started_at: datetime = Field(..., description="Execution start time")
-    completed_at: datetime = Field(..., description="Execution completion time")
-    duration_seconds: float = Field(..., ge=0, description="Execution duration")
+    status: str  # success, failed, timeout
+    error_message: Optional[str] = None  # Error if failed
 
-    status: str = Field(..., description="success, failed, timeout")
-    error_message: Optional[str] = Field(None, description="Error if failed")
+    tokens_used: Optional[int] = None  # LLM tokens consumed
+    cost_usd: Optional[float] = None  # Estimated cost
 
-    tokens_used: Optional[int] = Field(None, description="LLM tokens consumed")
-    cost_usd: Optional[float] = Field(None, description="Estimated cost")
 
-    model_config = ConfigDict(frozen=True)
+# Shared codec instances for persistence: building an Encoder/Decoder once
+# and reusing it is much cheaper than model_dump_json per object
+JSON_ENCODER = msgspec.json.Encoder()
+RECOMMENDATION_DECODER = msgspec.json.Decoder(StockRecommendation)
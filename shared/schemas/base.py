@@ -2,38 +2,210 @@
 Base schemas and common types used across all services.
 All timestamps are in UTC. All schemas are immutable after creation.
 """
-from datetime import datetime
-from enum import Enum
-from typing import Optional
-from pydantic import BaseModel, ConfigDict, Field
+import sys
+import time
+import uuid
+from dataclasses import dataclass, field as dc_field
+from datetime import date, datetime, timedelta, timezone
+from enum import Enum, IntEnum
+from functools import partial
+from typing import Optional, TypeVar
 
+import msgspec
 
-class TimestampedSchema(BaseModel):
-    """Base schema with creation timestamp (immutable)."""
+M = TypeVar("M")
 
-    model_config = ConfigDict(frozen=True)
+# Slotted frozen dataclass for in-process plumbing types (queries,
+# metadata, validation results): no Pydantic validation overhead for
+# data that never crosses a trust boundary, ~200B less per instance
+# from __slots__, and hashable for use as lru_cache keys.
+frozen_dc = partial(dataclass, slots=True, frozen=True)
 
-    created_at: datetime = Field(
-        default_factory=datetime.utcnow,
-        description="UTC timestamp when this record was created (immutable)"
-    )
 
+def _now_ns() -> int:
+    """
+    Wall-clock now as int64 epoch nanoseconds.
 
-class StockSymbol(BaseModel):
-    """Validated stock symbol."""
+    A single clock read with no datetime object construction — batch
+    wrappers created in ingestion loops store this and materialize a
+    datetime lazily only when something actually reads the timestamp.
+    """
+    return time.time_ns()
 
-    ticker: str = Field(..., min_length=1, max_length=10, description="Stock ticker symbol")
 
-    model_config = ConfigDict(frozen=True)
+def _ns_to_utc(ns: int) -> datetime:
+    """Naive UTC datetime for an epoch-nanosecond timestamp."""
+    return datetime.fromtimestamp(ns / 1e9, tz=timezone.utc).replace(tzinfo=None)
 
 
-class DateRange(BaseModel):
-    """Date range for queries."""
+_EPOCH_DATE = date(1970, 1, 1)
+_EPOCH_DT = datetime(1970, 1, 1)
 
-    start_date: datetime
-    end_date: datetime
+# Hot-path structs store calendar dates as epoch-day ordinals and
+# timestamps as epoch nanoseconds: plain ints compare and hash at
+# machine speed, cost 8 bytes instead of a ~48-byte date/datetime
+# object, and drop straight into datetime64 NumPy columns. Properties
+# on the structs materialize the object form on demand.
 
-    model_config = ConfigDict(frozen=True)
+
+def _date_to_days(d: date) -> int:
+    """Epoch-day ordinal for a calendar date."""
+    return (d - _EPOCH_DATE).days
+
+
+def _days_to_date(days: int) -> date:
+    """Calendar date for an epoch-day ordinal."""
+    return _EPOCH_DATE + timedelta(days=days)
+
+
+def _dt_to_ns(dt: datetime) -> int:
+    """
+    Epoch nanoseconds for a datetime (naive treated as UTC).
+
+    Integer arithmetic throughout — float timestamp() would lose
+    sub-microsecond precision at current epochs.
+    """
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return ((dt - _EPOCH_DT) // timedelta(microseconds=1)) * 1_000
+
+
+def _utcnow() -> datetime:
+    """
+    Naive UTC now for created_at defaults.
+
+    datetime.utcnow() is deprecated since 3.12; this keeps the same naive
+    value (matching the timezone-less DB columns) without the warning and
+    without a second datetime construction per instantiation.
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def load_trusted(cls: type[M], payload: dict) -> M:
+    """
+    Fast-path loader for payloads from our own immutable stores.
+
+    Snapshots and batch records are validated once when written and never
+    mutated, so re-validating them on every read wastes CPU. For Pydantic
+    models this uses model_construct (no field validation); msgspec
+    Structs construct at C level without validation anyway, so direct
+    construction suffices. Keep model_validate / typed decoders on
+    ingestion boundaries where the data is untrusted.
+    """
+    # model_construct exists only on Pydantic models; no isinstance
+    # check so this module need not import pydantic at all
+    construct = getattr(cls, "model_construct", None)
+    if construct is not None:
+        return construct(**payload)
+    return cls(**payload)
+
+
+@frozen_dc
+class BatchMetadata:
+    """
+    Side-record for per-batch bookkeeping, keyed by batch_id.
+
+    Batch wrappers are immutable and addressed by id, so their fetch
+    timestamp is pure provenance: carrying it inside the wrapper meant
+    re-serializing it into every persisted payload (and denormalized
+    copies downstream). Written once per batch instead; the row payloads
+    stay timestamp-free.
+    """
+
+    batch_id: uuid.UUID
+    # Epoch nanoseconds: one clock read at construction, no datetime alloc
+    fetched_at_ns: int = dc_field(default_factory=_now_ns)
+    source: str = ""  # Originating fetcher/pipeline, for traceability
+
+    @property
+    def fetched_at(self) -> datetime:
+        """Fetch time as naive UTC, materialized on demand."""
+        return _ns_to_utc(self.fetched_at_ns)
+
+
+# Identifier-like string fields interned on construction: each value
+# (ticker, source, model version, ...) repeats across millions of
+# records, so interning keeps one allocation per unique string and
+# makes equality an identity check
+_INTERNED_FIELDS = ("ticker", "source", "model_name", "model_version", "feature_version")
+
+
+class TimestampedStruct(msgspec.Struct, frozen=True, kw_only=True):
+    """
+    msgspec counterpart of TimestampedSchema for hot-path schemas.
+
+    Construction is C-level (no per-field Python validation); constraints
+    declared with msgspec.Meta are enforced when decoding from JSON.
+    Identifier-like string fields (_INTERNED_FIELDS) are sys.intern'd in
+    __post_init__, which also runs on decode.
+    """
+
+    # UTC timestamp when this record was created (immutable)
+    created_at: datetime = msgspec.field(default_factory=_utcnow)
+
+    def __post_init__(self):
+        for name in _INTERNED_FIELDS:
+            value = getattr(self, name, None)
+            if type(value) is str:
+                # force_setattr is the sanctioned escape hatch for
+                # frozen structs during __post_init__
+                msgspec.structs.force_setattr(self, name, sys.intern(value))
+
+
+def _build_pydantic_models() -> dict:
+    """
+    Define the remaining Pydantic models on first access.
+
+    Pydantic compiles a core schema per model class at definition time,
+    which dominates import cost for workers that only need the msgspec
+    structs and enums; deferring keeps `import shared.schemas.<module>`
+    pydantic-free until one of these API-facing classes is touched.
+    """
+    from pydantic import BaseModel, ConfigDict, Field
+
+    # BaseModel cannot drop its per-instance __dict__, so the hot-path
+    # classes use slotted msgspec Structs instead (TimestampedStruct);
+    # these low-volume API models just reject stray keys up front.
+    class TimestampedSchema(BaseModel):
+        """Base schema with creation timestamp (immutable)."""
+
+        model_config = ConfigDict(frozen=True, extra="forbid")
+
+        created_at: datetime = Field(
+            default_factory=_utcnow,
+            description="UTC timestamp when this record was created (immutable)"
+        )
+
+    class StockSymbol(BaseModel):
+        """Validated stock symbol."""
+
+        ticker: str = Field(..., min_length=1, max_length=10, description="Stock ticker symbol")
+
+        model_config = ConfigDict(frozen=True, extra="forbid")
+
+    class DateRange(BaseModel):
+        """Date range for queries."""
+
+        start_date: datetime
+        end_date: datetime
+
+        model_config = ConfigDict(frozen=True, extra="forbid")
+
+    return {
+        "TimestampedSchema": TimestampedSchema,
+        "StockSymbol": StockSymbol,
+        "DateRange": DateRange,
+    }
+
+
+_LAZY_PYDANTIC = ("TimestampedSchema", "StockSymbol", "DateRange")
+
+
+def __getattr__(name: str):
+    if name in _LAZY_PYDANTIC:
+        globals().update(_build_pydantic_models())
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class Recommendation(str, Enum):
@@ -54,6 +226,20 @@ class Signal(str, Enum):
     BEARISH = "BEARISH"
 
 
+class SignalCode(IntEnum):
+    """
+    Integer encoding of Signal for hot numeric paths.
+
+    Aggregation code stores these values in int8 numpy columns so bucket
+    counts are integer compares instead of per-row string equality; the
+    string Signal enum remains the API surface.
+    """
+
+    BEARISH = -1
+    NEUTRAL = 0
+    BULLISH = 1
+
+
 class RiskLevel(str, Enum):
     """Risk assessment levels."""
 
@@ -0,0 +1,55 @@
+"""
+Content-addressed blob store for large article bodies.
+
+Full article text dominates NewsBatch memory and serialization time, so
+NewsArticle keeps only a reference (content_uri) and the body lives
+here, keyed by its SHA-256. The backing store is a local directory tree
+(configurable via BLOB_STORE_ROOT; an S3 bucket slots in behind the
+same URI scheme later) — content addressing makes writes idempotent and
+dedupes identical bodies for free.
+
+Bodies at or under INLINE_LIMIT are worth keeping inline on the article
+(content_inline) to skip the fetch round-trip.
+"""
+import hashlib
+import os
+from pathlib import Path
+from typing import Optional
+
+# Bodies up to this size are cheaper inline than as a blob reference
+INLINE_LIMIT = 8 * 1024
+
+_URI_PREFIX = "blob://"
+
+
+def _root(root: Optional[Path] = None) -> Path:
+    return Path(root or os.environ.get("BLOB_STORE_ROOT", "data/blob_store"))
+
+
+def _path_for(digest: str, root: Optional[Path] = None) -> Path:
+    # Two-level fanout keeps directory listings manageable
+    return _root(root) / digest[:2] / digest
+
+
+def put_content(text: str, root: Optional[Path] = None) -> str:
+    """
+    Store an article body and return its blob URI.
+
+    Idempotent: identical bodies hash to the same URI and are written
+    only once.
+    """
+    data = text.encode("utf-8")
+    digest = hashlib.sha256(data).hexdigest()
+    path = _path_for(digest, root)
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+    return f"{_URI_PREFIX}{digest}"
+
+
+def fetch_content(uri: str, root: Optional[Path] = None) -> str:
+    """Fetch an article body by its blob URI."""
+    if not uri.startswith(_URI_PREFIX):
+        raise ValueError(f"Not a blob URI: {uri!r}")
+    digest = uri[len(_URI_PREFIX):]
+    return _path_for(digest, root).read_text("utf-8")
@@ -1,14 +1,101 @@
 """
 Feature Store schemas - CRITICAL for point-in-time correctness.
 All feature snapshots are APPEND-ONLY and IMMUTABLE.
+
+FeatureSnapshot is read and written in bulk by agents and backfills, so
+it (and the batch wrapper) are msgspec Structs (see agents.py); the
+query/validation/metadata classes are slotted frozen dataclasses — pure
+in-process plumbing with no untrusted input to validate.
 """
+import uuid
+from dataclasses import field as dc_field
 from datetime import date, datetime
-from typing import Any, Optional
-from pydantic import BaseModel, ConfigDict, Field
-from .base import TimestampedSchema
+from typing import ClassVar, Optional
+
+import msgspec
+import numpy as np
+
+from .base import TimestampedStruct, _days_to_date, _now_ns, _ns_to_utc, frozen_dc
+
+
+class TechnicalFeatureVector(msgspec.Struct, frozen=True):
+    """
+    Fixed-schema technical features for one snapshot.
+
+    Mirrors the TechnicalIndicators value fields. A typed struct instead
+    of dict[str, Any] means no per-feature hash lookup, no key strings in
+    every encoded snapshot, and a fixed layout that converts straight
+    into a NumPy row for agent-facing matrices.
+    """
 
+    # Canonical feature order for to_array(); append-only
+    _FIELD_ORDER: ClassVar[tuple[str, ...]] = (
+        "sma_20", "sma_50", "sma_200", "ema_12", "ema_26",
+        "rsi_14", "macd", "macd_signal", "macd_histogram",
+        "bollinger_upper", "bollinger_middle", "bollinger_lower",
+        "atr_14", "obv", "volatility_30d",
+    )
+
+    sma_20: Optional[float] = None
+    sma_50: Optional[float] = None
+    sma_200: Optional[float] = None
+    ema_12: Optional[float] = None
+    ema_26: Optional[float] = None
+    rsi_14: Optional[float] = None
+    macd: Optional[float] = None
+    macd_signal: Optional[float] = None
+    macd_histogram: Optional[float] = None
+    bollinger_upper: Optional[float] = None
+    bollinger_middle: Optional[float] = None
+    bollinger_lower: Optional[float] = None
+    atr_14: Optional[float] = None
+    obv: Optional[float] = None
+    volatility_30d: Optional[float] = None
+
+    def to_array(self) -> np.ndarray:
+        """Contiguous float32 vector in _FIELD_ORDER; None becomes NaN."""
+        return np.array(
+            [
+                np.nan if value is None else value
+                for value in (getattr(self, name) for name in self._FIELD_ORDER)
+            ],
+            dtype=np.float32,
+        )
+
+
+class SentimentFeatureVector(msgspec.Struct, frozen=True):
+    """
+    Fixed-schema sentiment features for one snapshot.
+
+    Mirrors the DailySentimentAggregate numeric fields; same rationale
+    as TechnicalFeatureVector.
+    """
+
+    # Canonical feature order for to_array(); append-only
+    _FIELD_ORDER: ClassVar[tuple[str, ...]] = (
+        "avg_sentiment", "weighted_sentiment", "article_count",
+        "positive_count", "neutral_count", "negative_count",
+    )
 
-class FeatureSnapshot(TimestampedSchema):
+    avg_sentiment: Optional[float] = None
+    weighted_sentiment: Optional[float] = None
+    article_count: Optional[int] = None
+    positive_count: Optional[int] = None
+    neutral_count: Optional[int] = None
+    negative_count: Optional[int] = None
+
+    def to_array(self) -> np.ndarray:
+        """Contiguous float32 vector in _FIELD_ORDER; None becomes NaN."""
+        return np.array(
+            [
+                np.nan if value is None else value
+                for value in (getattr(self, name) for name in self._FIELD_ORDER)
+            ],
+            dtype=np.float32,
+        )
+
+
+class FeatureSnapshot(TimestampedStruct, kw_only=True):
     """
     APPEND-ONLY feature snapshot for a specific ticker and date.
 
@@ -19,82 +106,138 @@ class FeatureSnapshot(TimestampedSchema):
     - Never updated, only new versions appended
     """
 
-    snapshot_id: str = Field(..., description="Unique snapshot identifier (UUID)")
-    ticker: str = Field(..., description="Stock ticker")
-    as_of_date: date = Field(..., description="Date this snapshot represents")
+    # Unique snapshot identifier: a real uuid.UUID, not its 36-char
+    # string form — 16-byte value, int-based hash computed once, and a
+    # fixed-width binary column in the columnar log
+    snapshot_id: uuid.UUID
+    ticker: str  # Stock ticker
+    # Snapshot date as epoch-day ordinal (see base._date_to_days)
+    as_of_date_days: int
 
-    # Technical features (from market data)
-    technical_features: dict[str, Any] = Field(
-        default_factory=dict,
-        description="All technical indicators as of this date"
-    )
+    feature_version: str  # Feature schema version
 
-    # Sentiment features (from news)
-    sentiment_features: dict[str, Any] = Field(
-        default_factory=dict,
-        description="All sentiment metrics as of this date"
-    )
+    # All technical indicators as of this date (None if unavailable)
+    technical_features: Optional[TechnicalFeatureVector] = None
 
-    # Metadata for reproducibility
-    feature_version: str = Field(..., description="Feature schema version")
-    data_sources: dict[str, str] = Field(
-        default_factory=dict,
-        description="Source identifiers for traceability"
-    )
+    # All sentiment metrics as of this date (None if unavailable)
+    sentiment_features: Optional[SentimentFeatureVector] = None
+
+    # Source identifiers for traceability
+    data_sources: dict[str, str] = msgspec.field(default_factory=dict)
+
+    @property
+    def as_of_date(self) -> date:
+        """Snapshot date, materialized on demand from the day ordinal."""
+        return _days_to_date(self.as_of_date_days)
 
-    model_config = ConfigDict(frozen=True)
 
+@frozen_dc
+class FeatureSnapshotMetadata:
+    """
+    Metadata about available feature snapshots.
 
-class FeatureSnapshotMetadata(BaseModel):
-    """Metadata about available feature snapshots."""
+    In-process plumbing only (one per read), hence a slotted frozen
+    dataclass rather than a validated model — see frozen_dc in base.py.
+    """
 
     ticker: str
     as_of_date: date
-    snapshot_id: str
+    snapshot_id: uuid.UUID
     feature_version: str
     created_at: datetime
-    has_technical: bool = Field(..., description="Technical features available")
-    has_sentiment: bool = Field(..., description="Sentiment features available")
+    has_technical: bool  # Technical features available
+    has_sentiment: bool  # Sentiment features available
 
-    model_config = ConfigDict(frozen=True)
 
-
-class FeatureValidation(BaseModel):
+@frozen_dc
+class FeatureValidation:
     """
     Validation result for feature quality.
     Used to flag incomplete or suspicious data.
     """
 
-    snapshot_id: str
+    snapshot_id: uuid.UUID
     is_valid: bool
-    validation_errors: list[str] = Field(default_factory=list)
-    validation_warnings: list[str] = Field(default_factory=list)
-    validated_at: datetime = Field(default_factory=datetime.utcnow)
+    validation_errors: list[str] = dc_field(default_factory=list)
+    validation_warnings: list[str] = dc_field(default_factory=list)
+    # Epoch nanoseconds: one clock read at construction, no datetime alloc
+    validated_at_ns: int = dc_field(default_factory=_now_ns)
 
-    model_config = ConfigDict(frozen=True)
+    @property
+    def validated_at(self) -> datetime:
+        """Validation time as naive UTC, materialized on demand."""
+        return _ns_to_utc(self.validated_at_ns)
 
 
-class FeatureQuery(BaseModel):
+@frozen_dc
+class FeatureQuery:
     """Query parameters for retrieving feature snapshots."""
 
     ticker: str
     as_of_date: date
-    feature_version: Optional[str] = Field(
-        None,
-        description="Specific version, or latest if not specified"
-    )
+    # Specific version, or latest if not specified
+    feature_version: Optional[str] = None
 
-    model_config = ConfigDict(frozen=True)
 
+@frozen_dc
+class FeatureBatchQuery:
+    """
+    Query for many tickers' snapshots at one date in a single call.
 
-class FeatureBatch(BaseModel):
+    Amortizes the log open/scan across N tickers instead of issuing N
+    FeatureQuery round trips — see feature_store_io.load_batch.
+    """
+
+    tickers: tuple[str, ...]
+    as_of_date: date
+    # Specific version, or latest if not specified
+    feature_version: Optional[str] = None
+
+
+class FeatureBatch(msgspec.Struct, frozen=True, kw_only=True):
     """
     Batch of feature snapshots for agent consumption.
     Used when agents need to reason over multiple stocks/dates.
     """
 
-    snapshots: list[FeatureSnapshot]
-    batch_id: str = Field(..., description="Batch identifier for tracking")
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-
-    model_config = ConfigDict(frozen=True)
+    # Tuple matches the frozen semantics and skips list over-allocation
+    snapshots: tuple[FeatureSnapshot, ...]
+    # Creation timestamp and provenance live in a BatchMetadata
+    # side-record keyed by this id (see base.py) — not in every
+    # persisted payload
+    batch_id: uuid.UUID = msgspec.field(default_factory=uuid.uuid4)
+
+    def feature_matrix(self) -> np.ndarray:
+        """
+        (N, F) contiguous float32 matrix of technical features, one row
+        per snapshot in batch order (all-NaN where a snapshot has none).
+        Built in one pass so agents run vectorized math instead of
+        per-snapshot attribute access; pair with tickers()/dates() for
+        join keys.
+        """
+        n_fields = len(TechnicalFeatureVector._FIELD_ORDER)
+        if not self.snapshots:
+            return np.empty((0, n_fields), dtype=np.float32)
+        blank = TechnicalFeatureVector()
+        return np.stack(
+            [(s.technical_features or blank).to_array() for s in self.snapshots]
+        )
+
+    def tickers(self) -> np.ndarray:
+        """Snapshot tickers aligned with feature_matrix rows."""
+        return np.array([s.ticker for s in self.snapshots], dtype=object)
+
+    def dates(self) -> np.ndarray:
+        """Snapshot as_of_dates (datetime64[D]) aligned with feature_matrix rows."""
+        # Day ordinals reinterpret as datetime64[D] without parsing
+        return np.fromiter(
+            (s.as_of_date_days for s in self.snapshots),
+            dtype=np.int64,
+            count=len(self.snapshots),
+        ).astype("datetime64[D]")
+
+
+# Shared codec instances for batch boundaries (see agents.py)
+JSON_ENCODER = msgspec.json.Encoder()
+FEATURE_BATCH_DECODER = msgspec.json.Decoder(FeatureBatch)
+SNAPSHOT_DECODER = msgspec.json.Decoder(FeatureSnapshot)
@@ -0,0 +1,226 @@
+"""
+Columnar on-disk format for the append-only FeatureSnapshot log.
+
+Snapshots are immutable and written in bulk, which makes them an ideal
+columnar workload: one Parquet file per append with dictionary-encoded
+ticker/feature_version columns, date32 dates, and each feature vector
+exploded into scalar columns (tech_*/sent_*). Dictionary + zstd typically
+shrinks the log 5-20x versus per-snapshot JSON blobs, and readers get
+whole feature columns as NumPy arrays without touching Python objects.
+
+pyarrow is imported inside the functions so the schema package keeps no
+hard dependency on it.
+"""
+import uuid
+from functools import lru_cache
+from typing import Iterable, List, Optional
+
+import msgspec
+
+from .base import _date_to_days
+from .feature_store import (
+    FeatureBatch,
+    FeatureBatchQuery,
+    FeatureQuery,
+    FeatureSnapshot,
+    SentimentFeatureVector,
+    TechnicalFeatureVector,
+)
+
+_JSON_ENCODER = msgspec.json.Encoder()
+_SOURCES_DECODER = msgspec.json.Decoder(dict[str, str])
+
+
+def write_snapshots(snapshots: Iterable[FeatureSnapshot], path) -> int:
+    """
+    Write snapshots as one columnar Parquet file.
+
+    Returns the number of snapshots written. Feature vectors explode
+    into one scalar column per field; has_technical/has_sentiment flags
+    distinguish an absent vector from one whose fields are all None.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    snapshots = list(snapshots)
+
+    columns = {
+        # Fixed-width 16-byte UUIDs: no per-row string offsets, and
+        # contiguous byte buffers for bulk joins on the read side
+        "snapshot_id": pa.array(
+            [s.snapshot_id.bytes for s in snapshots], type=pa.binary(16)
+        ),
+        "ticker": pa.array([s.ticker for s in snapshots]).dictionary_encode(),
+        # date32 is epoch days on the wire — the ordinals pass through
+        "as_of_date": pa.array(
+            [s.as_of_date_days for s in snapshots], type=pa.date32()
+        ),
+        "feature_version": pa.array(
+            [s.feature_version for s in snapshots]
+        ).dictionary_encode(),
+        "created_at": pa.array([s.created_at for s in snapshots], type=pa.timestamp("us")),
+        "has_technical": pa.array([s.technical_features is not None for s in snapshots]),
+        "has_sentiment": pa.array([s.sentiment_features is not None for s in snapshots]),
+        "data_sources_json": pa.array(
+            [_JSON_ENCODER.encode(s.data_sources).decode() for s in snapshots]
+        ),
+    }
+    for name in TechnicalFeatureVector._FIELD_ORDER:
+        columns[f"tech_{name}"] = pa.array(
+            [
+                getattr(s.technical_features, name) if s.technical_features else None
+                for s in snapshots
+            ],
+            type=pa.float64(),
+        )
+    for name in SentimentFeatureVector._FIELD_ORDER:
+        columns[f"sent_{name}"] = pa.array(
+            [
+                getattr(s.sentiment_features, name) if s.sentiment_features else None
+                for s in snapshots
+            ],
+            type=pa.float64(),
+        )
+
+    pq.write_table(
+        pa.table(columns), path, compression="zstd", use_dictionary=True
+    )
+    # The log changed under any cached reads of this file
+    invalidate_cache()
+    return len(snapshots)
+
+
+def read_snapshots(path) -> List[FeatureSnapshot]:
+    """
+    Read a snapshot Parquet file back into FeatureSnapshot structs.
+
+    Columns are bulk-converted once (C-level to_pylist); struct
+    construction skips validation — the log was validated at write time
+    (the trusted-read contract, see base.load_trusted).
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    table = pq.read_table(path)
+    data = {name: table.column(name).to_pylist() for name in table.column_names}
+    # date32 is already epoch days; read the ordinals, not date objects
+    data["as_of_date"] = table.column("as_of_date").cast(pa.int32()).to_pylist()
+    count = len(table)
+
+    snapshots = []
+    for i in range(count):
+        technical = None
+        if data["has_technical"][i]:
+            technical = TechnicalFeatureVector(
+                **{
+                    name: data[f"tech_{name}"][i]
+                    for name in TechnicalFeatureVector._FIELD_ORDER
+                }
+            )
+        sentiment = None
+        if data["has_sentiment"][i]:
+            # Count fields come back as float64; restore ints
+            values = {
+                name: data[f"sent_{name}"][i]
+                for name in SentimentFeatureVector._FIELD_ORDER
+            }
+            for name, value in values.items():
+                if name.endswith("_count") and value is not None:
+                    values[name] = int(value)
+            sentiment = SentimentFeatureVector(**values)
+        snapshots.append(
+            FeatureSnapshot(
+                snapshot_id=uuid.UUID(bytes=data["snapshot_id"][i]),
+                ticker=data["ticker"][i],
+                as_of_date_days=data["as_of_date"][i],
+                feature_version=data["feature_version"][i],
+                created_at=data["created_at"][i],
+                technical_features=technical,
+                sentiment_features=sentiment,
+                data_sources=_SOURCES_DECODER.decode(data["data_sources_json"][i]),
+            )
+        )
+    return snapshots
+
+
+# --- Read-through snapshot cache ------------------------------------------
+#
+# Agents re-ask for the same (ticker, as_of_date, feature_version) far
+# more often than the log changes; FeatureQuery is a hashable frozen
+# dataclass, so a cache hit is one dict lookup instead of a parquet
+# read + scan. The log is append-only, so entries only go stale when a
+# write lands — write_snapshots invalidates both layers.
+
+
+@lru_cache(maxsize=32)
+def _cached_file(path: str) -> tuple:
+    """One decode per log file, shared by all queries against it."""
+    return tuple(read_snapshots(path))
+
+
+@lru_cache(maxsize=100_000)
+def _cached_lookup(query: FeatureQuery, path: str) -> Optional[FeatureSnapshot]:
+    day = _date_to_days(query.as_of_date)
+    best = None
+    for snapshot in _cached_file(path):
+        if snapshot.ticker != query.ticker or snapshot.as_of_date_days != day:
+            continue
+        if query.feature_version is not None:
+            if snapshot.feature_version == query.feature_version:
+                return snapshot
+        elif best is None or snapshot.created_at > best.created_at:
+            best = snapshot  # Latest version wins when none requested
+    return best
+
+
+def load_snapshot(query: FeatureQuery, path, *,
+                  cached: bool = True) -> Optional[FeatureSnapshot]:
+    """
+    Load the snapshot matching a query from a log file, or None.
+
+    With cached=True (the default) repeated queries hit the in-process
+    LRU; pass cached=False to force a fresh read of the file.
+    """
+    if not cached:
+        invalidate_cache()
+    return _cached_lookup(query, str(path))
+
+
+def load_batch(query: FeatureBatchQuery, path, *,
+               cached: bool = True) -> FeatureBatch:
+    """
+    Load snapshots for many tickers at one date in a single scan.
+
+    One pass over the (cached) log file serves all tickers in the query
+    — N FeatureQuery calls would pay the open/scan N times. Snapshots
+    come back in query-ticker order; tickers with no matching snapshot
+    are simply absent from the batch. Version resolution matches
+    load_snapshot (exact match, or latest when none requested).
+    """
+    if not cached:
+        invalidate_cache()
+    day = _date_to_days(query.as_of_date)
+    wanted = set(query.tickers)
+    chosen: dict[str, FeatureSnapshot] = {}
+    for snapshot in _cached_file(str(path)):
+        if snapshot.as_of_date_days != day or snapshot.ticker not in wanted:
+            continue
+        if query.feature_version is not None:
+            if snapshot.feature_version == query.feature_version:
+                chosen[snapshot.ticker] = snapshot
+        else:
+            best = chosen.get(snapshot.ticker)
+            if best is None or snapshot.created_at > best.created_at:
+                chosen[snapshot.ticker] = snapshot
+    return FeatureBatch(
+        snapshots=tuple(
+            chosen[ticker] for ticker in query.tickers if ticker in chosen
+        ),
+        batch_id=uuid.uuid4(),
+    )
+
+
+def invalidate_cache() -> None:
+    """Drop all cached log reads and query results."""
+    _cached_file.cache_clear()
+    _cached_lookup.cache_clear()
@@ -1,87 +1,324 @@
 """
 Market data schemas (OHLCV, technical indicators).
 These schemas represent deterministic, immutable market data.
+
+OHLCV bars and indicators are ingested in bulk, so the hot-path classes
+are msgspec Structs (see agents.py for the rationale): construction and
+JSON decode run at C speed, instances are __slots__-based, and the range
+constraints below are enforced on decode. StockInfo stays a Pydantic
+model — it is mutable, low-volume reference data.
 """
+import uuid
 from datetime import date, datetime
-from typing import Optional
-from pydantic import BaseModel, ConfigDict, Field
-from .base import TimestampedSchema
+from typing import Annotated, Optional
+
+import msgspec
+import numpy as np
+from msgspec import Meta
+
+from .base import TimestampedStruct, _days_to_date
+
+# Prices must be strictly positive; volumes merely non-negative
+PositivePrice = Annotated[float, Meta(gt=0)]
+
+# Fixed-point price quantization: int32 counts of $0.0001 ticks. Equity
+# tick sizes fit comfortably, and int32 columns halve the bytes scanned
+# per bar versus float64 in long-history backtests.
+PRICE_SCALE = 10_000
+
 
+def to_ticks(prices: np.ndarray) -> np.ndarray:
+    """Quantize float prices to int32 tick counts (PRICE_SCALE per unit)."""
+    return np.rint(np.asarray(prices, dtype=np.float64) * PRICE_SCALE).astype(np.int32)
 
-class OHLCVData(TimestampedSchema):
+
+def to_float(ticks: np.ndarray) -> np.ndarray:
+    """Expand int32 tick counts back to float64 prices."""
+    return np.asarray(ticks, dtype=np.float64) / PRICE_SCALE
+
+
+class OHLCVData(TimestampedStruct, kw_only=True):
     """
     Daily OHLCV (Open, High, Low, Close, Volume) data.
     Immutable once recorded.
     """
 
-    ticker: str = Field(..., description="Stock ticker symbol")
-    date: date = Field(..., description="Trading date")
-    open: float = Field(..., gt=0, description="Opening price")
-    high: float = Field(..., gt=0, description="High price")
-    low: float = Field(..., gt=0, description="Low price")
-    close: float = Field(..., gt=0, description="Closing price")
-    volume: int = Field(..., ge=0, description="Trading volume")
-    adjusted_close: Optional[float] = Field(None, description="Adjusted closing price")
+    ticker: str  # Stock ticker symbol
+    # Trading date as epoch-day ordinal (see base._date_to_days): 8-byte
+    # int compare/hash instead of a date object per bar
+    date_days: int
+    open: PositivePrice  # Opening price
+    high: PositivePrice  # High price
+    low: PositivePrice  # Low price
+    close: PositivePrice  # Closing price
+    volume: Annotated[int, Meta(ge=0)]  # Trading volume
+    adjusted_close: Optional[float] = None  # Adjusted closing price
 
-    model_config = ConfigDict(frozen=True)
+    @property
+    def date(self) -> date:
+        """Trading date, materialized on demand from the day ordinal."""
+        return _days_to_date(self.date_days)
 
 
-class TechnicalIndicators(TimestampedSchema):
+class TechnicalIndicators(TimestampedStruct, kw_only=True):
     """
     Technical indicators computed from OHLCV data.
     Deterministic and reproducible.
     """
 
-    ticker: str = Field(..., description="Stock ticker symbol")
-    date: date = Field(..., description="Calculation date")
+    ticker: str  # Stock ticker symbol
+    # Calculation date as epoch-day ordinal (see base._date_to_days)
+    date_days: int
 
     # Moving Averages
-    sma_20: Optional[float] = Field(None, description="20-day Simple Moving Average")
-    sma_50: Optional[float] = Field(None, description="50-day Simple Moving Average")
-    sma_200: Optional[float] = Field(None, description="200-day Simple Moving Average")
-    ema_12: Optional[float] = Field(None, description="12-day Exponential Moving Average")
-    ema_26: Optional[float] = Field(None, description="26-day Exponential Moving Average")
+    sma_20: Optional[float] = None  # 20-day Simple Moving Average
+    sma_50: Optional[float] = None  # 50-day Simple Moving Average
+    sma_200: Optional[float] = None  # 200-day Simple Moving Average
+    ema_12: Optional[float] = None  # 12-day Exponential Moving Average
+    ema_26: Optional[float] = None  # 26-day Exponential Moving Average
 
     # Momentum Indicators
-    rsi_14: Optional[float] = Field(None, ge=0, le=100, description="14-day Relative Strength Index")
-    macd: Optional[float] = Field(None, description="MACD (12, 26, 9)")
-    macd_signal: Optional[float] = Field(None, description="MACD Signal Line")
-    macd_histogram: Optional[float] = Field(None, description="MACD Histogram")
+    rsi_14: Optional[Annotated[float, Meta(ge=0, le=100)]] = None  # 14-day RSI
+    macd: Optional[float] = None  # MACD (12, 26, 9)
+    macd_signal: Optional[float] = None  # MACD Signal Line
 
     # Volatility
-    bollinger_upper: Optional[float] = Field(None, description="Bollinger Band Upper")
-    bollinger_middle: Optional[float] = Field(None, description="Bollinger Band Middle")
-    bollinger_lower: Optional[float] = Field(None, description="Bollinger Band Lower")
-    atr_14: Optional[float] = Field(None, ge=0, description="14-day Average True Range")
+    bollinger_upper: Optional[float] = None  # Bollinger Band Upper
+    bollinger_lower: Optional[float] = None  # Bollinger Band Lower
+    atr_14: Optional[Annotated[float, Meta(ge=0)]] = None  # 14-day Average True Range
 
     # Volume Indicators
-    obv: Optional[float] = Field(None, description="On-Balance Volume")
+    obv: Optional[float] = None  # On-Balance Volume
 
     # Volatility Metrics
-    volatility_30d: Optional[float] = Field(None, ge=0, le=1, description="30-day historical volatility")
+    volatility_30d: Optional[Annotated[float, Meta(ge=0, le=1)]] = None  # 30-day historical volatility
+
+    @property
+    def date(self) -> date:
+        """Calculation date, materialized on demand from the day ordinal."""
+        return _days_to_date(self.date_days)
+
+    # Derived views: these are pure functions of the stored components,
+    # so storing them wasted bytes and risked drifting out of sync
+    @property
+    def macd_histogram(self) -> Optional[float]:
+        """MACD Histogram (macd - macd_signal)."""
+        if self.macd is None or self.macd_signal is None:
+            return None
+        return self.macd - self.macd_signal
+
+    @property
+    def bollinger_middle(self) -> Optional[float]:
+        """Bollinger Band Middle: the 20-day SMA by definition."""
+        return self.sma_20
+
+
+class OHLCVFrame(msgspec.Struct):
+    """
+    Columnar (structure-of-arrays) view of one ticker's OHLCV history.
+
+    list[OHLCVData] is an array-of-structs: every indicator pass pays a
+    Python attribute lookup per field per bar. This frame keeps each
+    field in one contiguous NumPy array, so rolling/ewm and broadcast
+    operations run over cache-friendly columns; convert back to records
+    only at boundaries that need per-bar objects.
+
+    Prices are stored as int32 tick counts (see PRICE_SCALE) rather than
+    float64 — half the memory bandwidth on scans with no precision loss
+    at equity tick sizes. Use to_float()/close_prices() etc. where float
+    math is needed; adjusted_close stays float32 because it must carry
+    NaN for bars without an adjusted price.
+    """
+
+    ticker: str
+    date: np.ndarray  # datetime64[D]
+    open: np.ndarray  # int32 price ticks
+    high: np.ndarray  # int32 price ticks
+    low: np.ndarray  # int32 price ticks
+    close: np.ndarray  # int32 price ticks
+    volume: np.ndarray  # int64
+    adjusted_close: np.ndarray  # float32, NaN where unknown
+
+    def __len__(self) -> int:
+        return len(self.date)
+
+    @classmethod
+    def from_records(cls, records: list[OHLCVData]) -> "OHLCVFrame":
+        """Build a columnar frame from per-bar records (one ticker)."""
+        n = len(records)
 
-    model_config = ConfigDict(frozen=True)
+        def column(name: str) -> np.ndarray:
+            values = np.fromiter(
+                (getattr(r, name) for r in records), dtype=np.float64, count=n
+            )
+            return to_ticks(values)
 
+        return cls(
+            ticker=records[0].ticker if records else "",
+            # Day ordinals reinterpret as datetime64[D] without parsing
+            date=np.fromiter(
+                (r.date_days for r in records), dtype=np.int64, count=n
+            ).astype("datetime64[D]"),
+            open=column("open"),
+            high=column("high"),
+            low=column("low"),
+            close=column("close"),
+            volume=np.fromiter((r.volume for r in records), dtype=np.int64, count=n),
+            adjusted_close=np.fromiter(
+                (np.nan if r.adjusted_close is None else r.adjusted_close for r in records),
+                dtype=np.float32,
+                count=n,
+            ),
+        )
 
-class StockInfo(BaseModel):
-    """Stock company information (mostly static)."""
+    @classmethod
+    def from_arrow(cls, ticker: str, batch) -> "OHLCVFrame":
+        """
+        Build a frame from an Arrow RecordBatch/Table of bars.
 
-    ticker: str = Field(..., description="Stock ticker symbol")
-    company_name: str = Field(..., description="Company name")
-    sector: Optional[str] = Field(None, description="Industry sector")
-    industry: Optional[str] = Field(None, description="Industry")
-    market_cap: Optional[float] = Field(None, description="Market capitalization")
-    description: Optional[str] = Field(None, description="Company description")
+        Columns land as whole NumPy arrays (zero-copy where Arrow's
+        layout allows) and prices are quantized to ticks in one
+        vectorized pass — no per-bar Python object construction.
+        Expects date, open, high, low, close, volume and optionally
+        adjusted_close columns.
+        """
+        def numpy_column(name: str) -> np.ndarray:
+            return batch.column(name).to_numpy(zero_copy_only=False)
 
-    model_config = ConfigDict(frozen=False)  # Can be updated
+        if "adjusted_close" in batch.schema.names:
+            adjusted = numpy_column("adjusted_close").astype(np.float32)
+        else:
+            adjusted = np.full(len(batch), np.nan, dtype=np.float32)
 
+        return cls(
+            ticker=ticker,
+            date=numpy_column("date").astype("datetime64[D]"),
+            open=to_ticks(numpy_column("open")),
+            high=to_ticks(numpy_column("high")),
+            low=to_ticks(numpy_column("low")),
+            close=to_ticks(numpy_column("close")),
+            volume=numpy_column("volume").astype(np.int64),
+            adjusted_close=adjusted,
+        )
 
-class MarketDataBatch(BaseModel):
+    def to_arrow(self):
+        """Arrow RecordBatch of this frame (float prices) for columnar consumers."""
+        import pyarrow as pa
+
+        return pa.record_batch({
+            "date": self.date,
+            "open": to_float(self.open),
+            "high": to_float(self.high),
+            "low": to_float(self.low),
+            "close": to_float(self.close),
+            "volume": self.volume,
+            "adjusted_close": self.adjusted_close,
+        })
+
+    def close_prices(self) -> np.ndarray:
+        """Closing prices as float64 (expanded from ticks)."""
+        return to_float(self.close)
+
+    def to_records(self) -> list[OHLCVData]:
+        """Materialize per-bar records for row-oriented consumers."""
+        # datetime64[D] -> int64 is a reinterpret, matching date_days
+        day_ints = self.date.astype(np.int64)
+        opens = to_float(self.open)
+        highs = to_float(self.high)
+        lows = to_float(self.low)
+        closes = to_float(self.close)
+        return [
+            OHLCVData(
+                ticker=self.ticker,
+                date_days=int(day_ints[i]),
+                open=opens[i],
+                high=highs[i],
+                low=lows[i],
+                close=closes[i],
+                volume=int(self.volume[i]),
+                adjusted_close=None if np.isnan(adj) else float(adj),
+            )
+            for i, adj in enumerate(self.adjusted_close)
+        ]
+
+
+def _build_pydantic_models() -> dict:
+    """
+    Define StockInfo on first access (see base._build_pydantic_models).
+
+    Deferring the class definition keeps pydantic — and its per-model
+    core-schema compilation — off the import path of workers that only
+    touch the msgspec structs.
+    """
+    from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+    class StockInfo(BaseModel):
+        """Stock company information (mostly static)."""
+
+        ticker: str = Field(..., description="Stock ticker symbol")
+        company_name: str = Field(..., description="Company name")
+        sector: Optional[str] = Field(None, description="Industry sector")
+        industry: Optional[str] = Field(None, description="Industry")
+        market_cap: Optional[float] = Field(None, description="Market capitalization")
+        description: Optional[str] = Field(None, description="Company description")
+
+        model_config = ConfigDict(frozen=False)  # Can be updated
+
+    return {
+        "StockInfo": StockInfo,
+        # Precompiled validators/serializers; each ad-hoc
+        # model_validate_json call would rebuild this state internally
+        "STOCK_INFO_ADAPTER": TypeAdapter(StockInfo),
+        "STOCK_INFO_LIST_ADAPTER": TypeAdapter(list[StockInfo]),
+    }
+
+
+_LAZY_PYDANTIC = ("StockInfo", "STOCK_INFO_ADAPTER", "STOCK_INFO_LIST_ADAPTER")
+
+
+def __getattr__(name: str):
+    if name in _LAZY_PYDANTIC:
+        globals().update(_build_pydantic_models())
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class MarketDataBatch(msgspec.Struct, frozen=True, kw_only=True):
     """Batch of market data for efficient processing."""
 
     ticker: str
     ohlcv_records: list[OHLCVData]
     technical_indicators: list[TechnicalIndicators]
-    fetched_at: datetime = Field(default_factory=datetime.utcnow)
+    # Fetch timestamp and provenance live in a BatchMetadata side-record
+    # keyed by this id (see base.py) — not in every persisted payload
+    batch_id: uuid.UUID = msgspec.field(default_factory=uuid.uuid4)
+
+    def ohlcv_frame(self) -> OHLCVFrame:
+        """Columnar view of this batch's bars for vectorized consumers."""
+        return OHLCVFrame.from_records(self.ohlcv_records)
+
+    @classmethod
+    def from_arrow(cls, ticker: str, ohlcv_batch,
+                   technical_indicators: list[TechnicalIndicators] = None) -> "MarketDataBatch":
+        """
+        Build a batch from an Arrow RecordBatch of bars.
+
+        Records are materialized once here via the columnar frame;
+        numeric consumers should prefer holding the OHLCVFrame itself
+        (a frozen Struct field cannot defer the record list lazily).
+        """
+        frame = OHLCVFrame.from_arrow(ticker, ohlcv_batch)
+        return cls(
+            ticker=ticker,
+            ohlcv_records=frame.to_records(),
+            technical_indicators=technical_indicators or [],
+        )
+
 
-    model_config = ConfigDict(frozen=True)
+# Shared codec instances for batch boundaries (see agents.py); the list
+# decoders cover feeds that deliver plain JSON arrays of records
+JSON_ENCODER = msgspec.json.Encoder()
+MARKET_DATA_BATCH_DECODER = msgspec.json.Decoder(MarketDataBatch)
+OHLCV_DECODER = msgspec.json.Decoder(OHLCVData)
+OHLCV_LIST_DECODER = msgspec.json.Decoder(list[OHLCVData])
+INDICATOR_LIST_DECODER = msgspec.json.Decoder(list[TechnicalIndicators])
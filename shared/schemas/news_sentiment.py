@@ -1,109 +1,230 @@
 """
 News and sentiment analysis schemas.
 Sentiment scores are probabilistic but stored immutably.
+
+Articles and per-article sentiment arrive thousands at a time from the
+news pipeline, so these are msgspec Structs (see agents.py): C-level
+construction and decode, __slots__ layout, constraints enforced when
+decoding from JSON.
 """
+import uuid
 from datetime import date, datetime
-from typing import Optional
-from pydantic import BaseModel, ConfigDict, Field
-from .base import TimestampedSchema
+from typing import Annotated, Optional, Sequence
 
+import msgspec
+import numpy as np
+from msgspec import Meta
 
-class NewsArticle(TimestampedSchema):
-    """
-    Raw news article (immutable historical record).
-    """
+from .base import TimestampedStruct, _days_to_date, _ns_to_utc
+from .themes import THEMES
 
-    ticker: str = Field(..., description="Related stock ticker")
-    published_at: datetime = Field(..., description="Article publication timestamp")
-    headline: str = Field(..., min_length=1, description="Article headline")
-    content: Optional[str] = Field(None, description="Full article content")
-    source: str = Field(..., description="News source")
-    url: Optional[str] = Field(None, description="Article URL")
-    author: Optional[str] = Field(None, description="Article author")
+# Sentiment scores live on [-1, 1]: -1 very negative, +1 very positive
+SentimentScore = Annotated[float, Meta(ge=-1.0, le=1.0)]
+# Confidence and other unit-interval quantities
+UnitFloat = Annotated[float, Meta(ge=0.0, le=1.0)]
 
-    model_config = ConfigDict(frozen=True)
+_NS_PER_DAY = 86_400_000_000_000
 
 
-class NewsSentiment(TimestampedSchema):
+class NewsArticle(TimestampedStruct, kw_only=True):
+    """
+    Raw news article (immutable historical record).
+    """
+
+    ticker: str  # Related stock ticker
+    published_at: datetime  # Article publication timestamp
+    headline: Annotated[str, Meta(min_length=1)]  # Article headline
+    source: str  # News source
+    # Full bodies dominate batch memory, so large content lives in the
+    # blob store (blob_store.put_content) and only the reference travels
+    # with the article; bodies <= blob_store.INLINE_LIMIT stay inline
+    content_uri: Optional[str] = None  # Blob-store reference to full content
+    content_inline: Optional[str] = None  # Small bodies kept inline
+    url: Optional[str] = None  # Article URL
+    author: Optional[str] = None  # Article author
+
+    def fetch_content(self) -> Optional[str]:
+        """Article body: inline if small, else fetched from the blob store."""
+        if self.content_inline is not None:
+            return self.content_inline
+        if self.content_uri is not None:
+            from .blob_store import fetch_content
+            return fetch_content(self.content_uri)
+        return None
+
+
+class NewsSentiment(TimestampedStruct, kw_only=True):
     """
     Sentiment analysis result for a news article.
     Immutable once computed.
     """
 
-    article_id: str = Field(..., description="Reference to news article")
-    ticker: str = Field(..., description="Stock ticker")
-    published_at: datetime = Field(..., description="Article publication time")
+    # Article reference: a real uuid.UUID, not its 36-char string form
+    # — 16-byte value with an int-based hash computed once, so
+    # cross-reference joins stop re-hashing strings
+    article_id: uuid.UUID
+    ticker: str  # Stock ticker
+    # Publication time as epoch nanoseconds (see base._dt_to_ns): 8-byte
+    # int per record instead of a datetime object, and a straight
+    # divide/astype into datetime64 columns for aggregation
+    published_at_ns: int
 
     # Sentiment scores
-    sentiment_score: float = Field(
-        ...,
-        ge=-1.0,
-        le=1.0,
-        description="Sentiment score: -1 (very negative) to +1 (very positive)"
-    )
-    confidence: float = Field(
-        ...,
-        ge=0.0,
-        le=1.0,
-        description="Confidence in sentiment score"
-    )
-
-    # Extracted themes
-    themes: list[str] = Field(
-        default_factory=list,
-        description="Key themes/topics extracted from article"
-    )
+    sentiment_score: SentimentScore
+    confidence: UnitFloat
 
     # Model metadata
-    model_name: str = Field(..., description="Model used for sentiment analysis")
-    model_version: str = Field(..., description="Version of sentiment model")
+    model_name: str  # Model used for sentiment analysis
+    model_version: str  # Version of sentiment model
+
+    # Key themes/topics as integer codes (see themes.THEMES)
+    themes: tuple[int, ...] = ()
 
-    model_config = ConfigDict(frozen=True)
+    @property
+    def published_at(self) -> datetime:
+        """Publication time as naive UTC, materialized on demand."""
+        return _ns_to_utc(self.published_at_ns)
 
+    @property
+    def themes_text(self) -> list[str]:
+        """Theme strings resolved through the process theme dictionary."""
+        return THEMES.decode(self.themes)
 
-class DailySentimentAggregate(TimestampedSchema):
+
+class DailySentimentAggregate(TimestampedStruct, kw_only=True):
     """
     Aggregated sentiment for a ticker on a specific date.
     Point-in-time snapshot.
     """
 
-    ticker: str = Field(..., description="Stock ticker")
-    date: date = Field(..., description="Aggregation date")
+    ticker: str  # Stock ticker
+    # Aggregation date as epoch-day ordinal (see base._date_to_days)
+    date_days: int
 
     # Aggregated metrics
-    avg_sentiment: float = Field(
-        ...,
-        ge=-1.0,
-        le=1.0,
-        description="Average sentiment score for the day"
-    )
-    weighted_sentiment: float = Field(
-        ...,
-        ge=-1.0,
-        le=1.0,
-        description="Sentiment weighted by article prominence/confidence"
-    )
-    article_count: int = Field(..., ge=0, description="Number of articles analyzed")
-
-    # Top themes
-    top_themes: list[str] = Field(
-        default_factory=list,
-        description="Most frequent themes for the day"
-    )
+    avg_sentiment: SentimentScore  # Average sentiment score for the day
+    weighted_sentiment: SentimentScore  # Sentiment weighted by confidence
+    article_count: Annotated[int, Meta(ge=0)]  # Number of articles analyzed
 
     # Sentiment distribution
-    positive_count: int = Field(..., ge=0, description="Count of positive articles")
-    neutral_count: int = Field(..., ge=0, description="Count of neutral articles")
-    negative_count: int = Field(..., ge=0, description="Count of negative articles")
-
-    model_config = ConfigDict(frozen=True)
-
-
-class NewsBatch(BaseModel):
+    positive_count: Annotated[int, Meta(ge=0)]  # Count of positive articles
+    neutral_count: Annotated[int, Meta(ge=0)]  # Count of neutral articles
+    negative_count: Annotated[int, Meta(ge=0)]  # Count of negative articles
+
+    # Most frequent themes for the day, as integer codes (see themes.THEMES)
+    top_themes: tuple[int, ...] = ()
+
+    @property
+    def date(self) -> date:
+        """Aggregation date, materialized on demand from the day ordinal."""
+        return _days_to_date(self.date_days)
+
+    @property
+    def top_themes_text(self) -> list[str]:
+        """Theme strings resolved through the process theme dictionary."""
+        return THEMES.decode(self.top_themes)
+
+    @classmethod
+    def compute_batch(
+        cls,
+        sentiments: Sequence[NewsSentiment],
+        top_n: int = 5,
+    ) -> list["DailySentimentAggregate"]:
+        """
+        Roll per-article sentiment up to one aggregate per (ticker, day).
+
+        All reductions are single NumPy passes over stacked arrays
+        (bincount sums, one lexsort for theme ranking) rather than
+        per-record Python; only the final aggregates are materialized as
+        structs. Bucket thresholds match the news-sentiment service
+        (score > 0.1 positive, < -0.1 negative).
+        """
+        if not sentiments:
+            return []
+
+        n = len(sentiments)
+        scores = np.fromiter((s.sentiment_score for s in sentiments), np.float64, count=n)
+        confidences = np.fromiter((s.confidence for s in sentiments), np.float64, count=n)
+        tickers = np.array([s.ticker for s in sentiments], dtype=object)
+        # Epoch-ns timestamps floor-divide straight to epoch days — no
+        # datetime64 conversion pass needed
+        day_ints = np.fromiter(
+            (s.published_at_ns for s in sentiments), np.int64, count=n
+        ) // _NS_PER_DAY
+
+        # Group by (ticker, day) via combined integer keys
+        ticker_names, ticker_codes = np.unique(tickers, return_inverse=True)
+        day_span = int(day_ints.max()) - int(day_ints.min()) + 1
+        keys = ticker_codes.astype(np.int64) * day_span + (day_ints - day_ints.min())
+        group_keys, group_ids = np.unique(keys, return_inverse=True)
+        num_groups = len(group_keys)
+
+        counts = np.bincount(group_ids, minlength=num_groups)
+        score_sums = np.bincount(group_ids, weights=scores, minlength=num_groups)
+        conf_sums = np.bincount(group_ids, weights=confidences, minlength=num_groups)
+        weighted_sums = np.bincount(
+            group_ids, weights=scores * confidences, minlength=num_groups
+        )
+        positive = np.bincount(group_ids[scores > 0.1], minlength=num_groups)
+        negative = np.bincount(group_ids[scores < -0.1], minlength=num_groups)
+
+        avg = score_sums / counts
+        weighted = np.where(
+            conf_sums > 0, weighted_sums / np.maximum(conf_sums, 1e-12), avg
+        )
+
+        # Ticker / day per group, recovered from the combined keys
+        group_tickers = ticker_names[group_keys // day_span]
+        group_day_ints = group_keys % day_span + day_ints.min()
+
+        # Theme code counts per group: flatten once, rank with one lexsort
+        lengths = np.fromiter((len(s.themes) for s in sentiments), np.int64, count=n)
+        top_codes: list[tuple] = [() for _ in range(num_groups)]
+        if lengths.sum():
+            flat_codes = np.concatenate([np.asarray(s.themes, dtype=np.int64)
+                                         for s in sentiments if s.themes])
+            theme_groups = np.repeat(group_ids, lengths)
+            vocab = len(THEMES) or int(flat_codes.max()) + 1
+            pair_keys, pair_counts = np.unique(
+                theme_groups * vocab + flat_codes, return_counts=True
+            )
+            order = np.lexsort((-pair_counts, pair_keys // vocab))
+            pair_groups = (pair_keys // vocab)[order]
+            pair_codes = (pair_keys % vocab)[order]
+            starts = np.searchsorted(pair_groups, np.arange(num_groups), side="left")
+            keep = np.arange(len(pair_groups)) - starts[pair_groups] < top_n
+            for group, code in zip(pair_groups[keep], pair_codes[keep]):
+                top_codes[group] = top_codes[group] + (int(code),)
+
+        return [
+            cls(
+                ticker=group_tickers[g],
+                date_days=int(group_day_ints[g]),
+                avg_sentiment=float(avg[g]),
+                weighted_sentiment=float(weighted[g]),
+                article_count=int(counts[g]),
+                positive_count=int(positive[g]),
+                neutral_count=int(counts[g] - positive[g] - negative[g]),
+                negative_count=int(negative[g]),
+                top_themes=top_codes[g],
+            )
+            for g in range(num_groups)
+        ]
+
+
+class NewsBatch(msgspec.Struct, frozen=True, kw_only=True):
     """Batch of news articles for processing."""
 
     ticker: str
     articles: list[NewsArticle]
-    fetched_at: datetime = Field(default_factory=datetime.utcnow)
+    # Fetch timestamp and provenance live in a BatchMetadata side-record
+    # keyed by this id (see base.py) — not in every persisted payload
+    batch_id: uuid.UUID = msgspec.field(default_factory=uuid.uuid4)
+
 
-    model_config = ConfigDict(frozen=True)
+# Shared codec instances for batch boundaries (see agents.py); the list
+# decoders cover feeds that deliver plain JSON arrays of records
+JSON_ENCODER = msgspec.json.Encoder()
+NEWS_BATCH_DECODER = msgspec.json.Decoder(NewsBatch)
+ARTICLE_LIST_DECODER = msgspec.json.Decoder(list[NewsArticle])
+SENTIMENT_LIST_DECODER = msgspec.json.Decoder(list[NewsSentiment])
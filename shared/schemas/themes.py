@@ -0,0 +1,56 @@
+"""
+Integer-coded theme dictionary.
+
+Theme strings ("earnings", "product_launch", ...) repeat across nearly
+every article, so NewsSentiment and DailySentimentAggregate store
+uint16-sized integer codes and resolve strings through one process-local
+dictionary: O(unique themes) strings instead of O(records x themes), and
+downstream counting becomes np.bincount over small ints.
+
+The dictionary is append-only and its code assignment is insertion
+order, so persisting `snapshot()` (the name list) alongside written
+records is enough to decode them later via `from_names`.
+"""
+from typing import Dict, Iterable, List, Tuple
+
+
+class ThemeDictionary:
+    """Append-only string <-> int code table for themes."""
+
+    def __init__(self) -> None:
+        self._codes: Dict[str, int] = {}
+        self._names: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def encode(self, themes: Iterable[str]) -> Tuple[int, ...]:
+        """Map theme strings to codes, registering unseen themes."""
+        codes = []
+        for theme in themes:
+            code = self._codes.get(theme)
+            if code is None:
+                code = len(self._names)
+                self._codes[theme] = code
+                self._names.append(theme)
+            codes.append(code)
+        return tuple(codes)
+
+    def decode(self, codes: Iterable[int]) -> List[str]:
+        """Map codes back to theme strings in order."""
+        return [self._names[code] for code in codes]
+
+    def snapshot(self) -> List[str]:
+        """Copy of the vocabulary in code order, for persistence."""
+        return list(self._names)
+
+    @classmethod
+    def from_names(cls, names: Iterable[str]) -> "ThemeDictionary":
+        """Rebuild a dictionary from a persisted vocabulary snapshot."""
+        dictionary = cls()
+        dictionary.encode(names)
+        return dictionary
+
+
+# Process-local default used by the theme-coded schema fields
+THEMES = ThemeDictionary()